@@ -23,42 +23,100 @@ For more information, see:
 - Package Documentation: https://github.com/openf1-client/openf1-python
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 from openf1_client.client import OpenF1Client
-from openf1_client.config import ClientConfig
-from openf1_client.errors import (
-    OpenF1APIError,
-    OpenF1AuthError,
-    OpenF1ConfigError,
-    OpenF1Error,
-    OpenF1NotFoundError,
-    OpenF1RateLimitError,
-    OpenF1ServerError,
-    OpenF1TimeoutError,
-    OpenF1TransportError,
-    OpenF1ValidationError,
-)
-from openf1_client.models import (
-    CarData,
-    Driver,
-    Interval,
-    Lap,
-    Location,
-    Meeting,
-    Overtake,
-    Pit,
-    Position,
-    RaceControl,
-    Session,
-    SessionResult,
-    StartingGrid,
-    Stint,
-    TeamRadio,
-    Weather,
-)
-from openf1_client.utils import FilterBuilder, setup_logging
+
+
+if TYPE_CHECKING:
+    from openf1_client.config import ClientConfig
+    from openf1_client.errors import (
+        OpenF1APIError,
+        OpenF1AuthError,
+        OpenF1ConfigError,
+        OpenF1Error,
+        OpenF1NotFoundError,
+        OpenF1RateLimitError,
+        OpenF1ServerError,
+        OpenF1TimeoutError,
+        OpenF1TransportError,
+        OpenF1ValidationError,
+    )
+    from openf1_client.models import (
+        CarData,
+        Driver,
+        Interval,
+        Lap,
+        Location,
+        Meeting,
+        Overtake,
+        Pit,
+        Position,
+        RaceControl,
+        Session,
+        SessionResult,
+        StartingGrid,
+        Stint,
+        TeamRadio,
+        Weather,
+    )
+    from openf1_client.utils import FilterBuilder, setup_logging
 
 
 __version__ = "1.0.0"
+
+# PEP 562 lazy exports: symbol name -> defining module. Resolution happens
+# in __getattr__ on first access and the result is cached in globals(), so
+# `import openf1_client` stays cheap for scripts that only construct a
+# client (notably, the pydantic-backed models module is never parsed
+# unless a model or endpoint is actually used).
+_LAZY_EXPORTS = {
+    "ClientConfig": "openf1_client.config",
+    "OpenF1Error": "openf1_client.errors",
+    "OpenF1APIError": "openf1_client.errors",
+    "OpenF1AuthError": "openf1_client.errors",
+    "OpenF1ConfigError": "openf1_client.errors",
+    "OpenF1NotFoundError": "openf1_client.errors",
+    "OpenF1RateLimitError": "openf1_client.errors",
+    "OpenF1ServerError": "openf1_client.errors",
+    "OpenF1TimeoutError": "openf1_client.errors",
+    "OpenF1TransportError": "openf1_client.errors",
+    "OpenF1ValidationError": "openf1_client.errors",
+    "CarData": "openf1_client.models",
+    "Driver": "openf1_client.models",
+    "Interval": "openf1_client.models",
+    "Lap": "openf1_client.models",
+    "Location": "openf1_client.models",
+    "Meeting": "openf1_client.models",
+    "Overtake": "openf1_client.models",
+    "Pit": "openf1_client.models",
+    "Position": "openf1_client.models",
+    "RaceControl": "openf1_client.models",
+    "Session": "openf1_client.models",
+    "SessionResult": "openf1_client.models",
+    "StartingGrid": "openf1_client.models",
+    "Stint": "openf1_client.models",
+    "TeamRadio": "openf1_client.models",
+    "Weather": "openf1_client.models",
+    "FilterBuilder": "openf1_client.utils",
+    "setup_logging": "openf1_client.utils",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Resolve lazily-exported symbols on first access (PEP 562)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazy exports in dir(openf1_client)."""
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 __all__ = [
     # Main client
     "OpenF1Client",
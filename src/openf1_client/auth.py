@@ -9,9 +9,9 @@ from __future__ import annotations
 
 import logging
 import time
-from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+from urllib.parse import urlencode
 
 from openf1_client.errors import OpenF1AuthError, OpenF1ConfigError
 
@@ -22,8 +22,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("openf1_client")
 
+# Pre-bound clock for the per-request expiry checks; skips the module
+# attribute lookup on each call. Monotonic, so immune to wall-clock jumps.
+_now = time.monotonic
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class TokenInfo:
     """
     Container for OAuth2 token information.
@@ -43,6 +47,9 @@ class TokenInfo:
     expires_at: float | None = None
     scope: str | None = None
     refresh_token: str | None = None
+    # Monotonic deadline (expiry minus safety margin), precomputed once at
+    # construction so is_expired is a single load + comparison per call.
+    _deadline: float | None = field(default=None, repr=False, compare=False)
 
     @classmethod
     def from_response(cls, data: dict[str, Any]) -> "TokenInfo":
@@ -68,8 +75,12 @@ class TokenInfo:
 
         expires_in = data.get("expires_in")
         expires_at = None
+        deadline = None
         if expires_in is not None:
             expires_at = time.time() + expires_in
+            # Consider expired 60 seconds before actual expiration for safety.
+            # Monotonic basis avoids wall-clock jumps invalidating tokens early.
+            deadline = _now() + expires_in - 60
 
         return cls(
             access_token=access_token,
@@ -78,6 +89,7 @@ class TokenInfo:
             expires_at=expires_at,
             scope=data.get("scope"),
             refresh_token=data.get("refresh_token"),
+            _deadline=deadline,
         )
 
     @property
@@ -89,21 +101,22 @@ class TokenInfo:
             True if the token has expired, False otherwise.
             Returns False if expiration time is unknown.
         """
-        if self.expires_at is None:
-            return False
-        # Consider expired 60 seconds before actual expiration for safety
-        return time.time() >= (self.expires_at - 60)
+        return self._deadline is not None and _now() >= self._deadline
 
 
-class AuthProviderProtocol(ABC):
+@runtime_checkable
+class AuthProviderProtocol(Protocol):
     """
-    Abstract base class for authentication providers.
+    Structural interface for authentication providers.
 
     This protocol defines the interface for authentication mechanisms,
     allowing for different authentication strategies to be implemented.
+    Providers satisfy it by shape; no inheritance (or metaclass) is
+    required.
     """
 
-    @abstractmethod
+    __slots__ = ()
+
     def get_token(self) -> str | None:
         """
         Get the current access token.
@@ -113,7 +126,6 @@ class AuthProviderProtocol(ABC):
         """
         ...
 
-    @abstractmethod
     def authenticate(self) -> TokenInfo:
         """
         Perform authentication and obtain a token.
@@ -126,7 +138,6 @@ class AuthProviderProtocol(ABC):
         """
         ...
 
-    @abstractmethod
     def is_authenticated(self) -> bool:
         """
         Check if the client is currently authenticated.
@@ -136,13 +147,12 @@ class AuthProviderProtocol(ABC):
         """
         ...
 
-    @abstractmethod
     def clear(self) -> None:
         """Clear any stored authentication state."""
         ...
 
 
-class PasswordAuthProvider(AuthProviderProtocol):
+class PasswordAuthProvider:
     """
     OAuth2 password grant authentication provider.
 
@@ -155,6 +165,15 @@ class PasswordAuthProvider(AuthProviderProtocol):
         token_url: The URL for the token endpoint.
     """
 
+    __slots__ = (
+        "_username",
+        "_password",
+        "_token_url",
+        "_transport",
+        "_token_info",
+        "_form_body",
+    )
+
     def __init__(
         self,
         username: str,
@@ -184,6 +203,15 @@ class PasswordAuthProvider(AuthProviderProtocol):
         self._token_url = token_url
         self._transport = transport
         self._token_info: TokenInfo | None = None
+        # Encode the grant request once; refreshes reuse the same bytes
+        # instead of rebuilding and re-urlencoding the form dict.
+        self._form_body = urlencode(
+            {
+                "grant_type": "password",
+                "username": username,
+                "password": password,
+            }
+        ).encode("ascii")
 
     def get_token(self) -> str | None:
         """
@@ -195,13 +223,16 @@ class PasswordAuthProvider(AuthProviderProtocol):
         Returns:
             The access token string, or None if authentication fails.
         """
-        if self._token_info is None or self._token_info.is_expired:
-            try:
-                self.authenticate()
-            except OpenF1AuthError:
-                return None
+        # Fast path first: a valid token returns without entering the
+        # try block, keeping exception setup off the per-request branch.
+        token_info = self._token_info
+        if token_info is not None and not token_info.is_expired:
+            return token_info.access_token
 
-        return self._token_info.access_token if self._token_info else None
+        try:
+            return self.authenticate().access_token
+        except OpenF1AuthError:
+            return None
 
     def authenticate(self) -> TokenInfo:
         """
@@ -216,23 +247,21 @@ class PasswordAuthProvider(AuthProviderProtocol):
         logger.debug("Authenticating with password grant to %s", self._token_url)
 
         try:
-            response_data = self._transport.post_form(
+            response_data = self._transport.post_form_bytes(
                 url=self._token_url,
-                data={
-                    "grant_type": "password",
-                    "username": self._username,
-                    "password": self._password,
-                },
+                body=self._form_body,
             )
 
             self._token_info = TokenInfo.from_response(response_data)
             logger.debug("Authentication successful, token obtained")
             return self._token_info
 
+        except OpenF1AuthError as e:
+            logger.error("Authentication failed: %s", e)
+            raise
+
         except Exception as e:
             logger.error("Authentication failed: %s", e)
-            if isinstance(e, OpenF1AuthError):
-                raise
             raise OpenF1AuthError(
                 message=f"Authentication failed: {e}",
                 status_code=0,
@@ -257,7 +286,7 @@ class PasswordAuthProvider(AuthProviderProtocol):
         return self._token_info
 
 
-class TokenAuthProvider(AuthProviderProtocol):
+class TokenAuthProvider:
     """
     Simple token-based authentication provider.
 
@@ -266,6 +295,12 @@ class TokenAuthProvider(AuthProviderProtocol):
     token is obtained externally.
     """
 
+    __slots__ = ("_access_token",)
+
+    # is_authenticated is invariant for this provider; AuthManager reads
+    # this flag to skip the method dispatch on the common check.
+    _constant_auth = True
+
     def __init__(self, access_token: str) -> None:
         """
         Initialize the token auth provider.
@@ -325,7 +360,7 @@ class TokenAuthProvider(AuthProviderProtocol):
         self._access_token = access_token
 
 
-class NoAuthProvider(AuthProviderProtocol):
+class NoAuthProvider:
     """
     Null authentication provider for unauthenticated access.
 
@@ -333,6 +368,11 @@ class NoAuthProvider(AuthProviderProtocol):
     allowing access to public/historical API endpoints.
     """
 
+    __slots__ = ()
+
+    # Never authenticated; lets AuthManager answer without a method call.
+    _constant_auth = False
+
     def get_token(self) -> str | None:
         """Return None (no token)."""
         return None
@@ -366,6 +406,8 @@ class AuthManager:
     and handles token lifecycle management.
     """
 
+    __slots__ = ("_provider", "_cached_token", "_cached_deadline")
+
     def __init__(self, provider: AuthProviderProtocol) -> None:
         """
         Initialize the auth manager.
@@ -374,6 +416,10 @@ class AuthManager:
             provider: The authentication provider to use.
         """
         self._provider = provider
+        # Fast-path cache: last valid token string plus its monotonic expiry,
+        # so per-request auth checks avoid walking through the provider.
+        self._cached_token: str | None = None
+        self._cached_deadline: float = 0.0
 
     @property
     def provider(self) -> AuthProviderProtocol:
@@ -387,6 +433,8 @@ class AuthManager:
         Returns:
             The access token, or None if not authenticated.
         """
+        if self._cached_token is not None and _now() < self._cached_deadline:
+            return self._cached_token
         return self._provider.get_token()
 
     def authenticate(self) -> TokenInfo:
@@ -399,7 +447,9 @@ class AuthManager:
         Raises:
             OpenF1AuthError: If authentication fails.
         """
-        return self._provider.authenticate()
+        token_info = self._provider.authenticate()
+        self._cache_token(token_info)
+        return token_info
 
     def is_authenticated(self) -> bool:
         """
@@ -408,12 +458,31 @@ class AuthManager:
         Returns:
             True if authenticated with a valid token.
         """
+        constant = getattr(self._provider, "_constant_auth", None)
+        if constant is not None:
+            return constant
         return self._provider.is_authenticated()
 
     def clear(self) -> None:
         """Clear any stored authentication state."""
+        self._cached_token = None
+        self._cached_deadline = 0.0
         self._provider.clear()
 
+    def _cache_token(self, token_info: TokenInfo) -> None:
+        """
+        Store a token and its expiry in the fast-path cache.
+
+        Tokens without a known expiry (e.g. pre-existing tokens) are
+        cached indefinitely.
+
+        Args:
+            token_info: The token information to cache.
+        """
+        self._cached_token = token_info.access_token
+        deadline = token_info._deadline
+        self._cached_deadline = deadline if deadline is not None else float("inf")
+
     def ensure_authenticated(self) -> str:
         """
         Ensure the client is authenticated and return the token.
@@ -426,8 +495,22 @@ class AuthManager:
         Raises:
             OpenF1AuthError: If authentication fails.
         """
+        if self._cached_token is not None and _now() < self._cached_deadline:
+            return self._cached_token
+
         token = self.get_token()
         if token is None:
-            token_info = self.authenticate()
-            token = token_info.access_token
+            return self.authenticate().access_token
+
+        # Cache the expiry when the provider exposes it; providers without
+        # token info (e.g. pre-existing tokens) stay on the delegating path
+        # since their get_token is already a plain attribute read.
+        token_info = getattr(self._provider, "token_info", None)
+        if token_info is not None and token_info.access_token == token:
+            self._cache_token(token_info)
         return token
+
+
+# Shared stateless instance: NoAuthProvider holds no state and clear() is a
+# no-op, so every unauthenticated client can reuse the same object.
+NO_AUTH_PROVIDER: AuthProviderProtocol = NoAuthProvider()
@@ -7,34 +7,18 @@ interface for interacting with the OpenF1 API.
 
 from __future__ import annotations
 
+import importlib
 import logging
-from typing import Any, Literal
+from typing import Any, ClassVar, Literal
 
 from openf1_client.auth import (
+    NO_AUTH_PROVIDER,
     AuthManager,
     NoAuthProvider,
     PasswordAuthProvider,
     TokenAuthProvider,
 )
 from openf1_client.config import ClientConfig
-from openf1_client.endpoints import (
-    CarDataEndpoint,
-    DriversEndpoint,
-    IntervalsEndpoint,
-    LapsEndpoint,
-    LocationEndpoint,
-    MeetingsEndpoint,
-    OvertakesEndpoint,
-    PitEndpoint,
-    PositionEndpoint,
-    RaceControlEndpoint,
-    SessionResultEndpoint,
-    SessionsEndpoint,
-    StartingGridEndpoint,
-    StintsEndpoint,
-    TeamRadioEndpoint,
-    WeatherEndpoint,
-)
 from openf1_client.http_client import OpenF1Transport, SyncHTTPClient
 
 
@@ -94,6 +78,39 @@ class OpenF1Client:
         ... )
     """
 
+    # Registry of lazily-instantiated endpoint attributes, keyed by
+    # attribute name to (module, class name). The endpoint module is only
+    # imported when the attribute is first accessed in __getattr__, and the
+    # instance is then cached on the client, so subsequent lookups are
+    # plain attribute loads and unused endpoints never pay import cost.
+    _ENDPOINTS: ClassVar[dict[str, tuple[str, str]]] = {
+        "car_data": ("openf1_client.endpoints.car_data", "CarDataEndpoint"),
+        "drivers": ("openf1_client.endpoints.drivers", "DriversEndpoint"),
+        "intervals": ("openf1_client.endpoints.intervals", "IntervalsEndpoint"),
+        "laps": ("openf1_client.endpoints.laps", "LapsEndpoint"),
+        "location": ("openf1_client.endpoints.location", "LocationEndpoint"),
+        "meetings": ("openf1_client.endpoints.meetings", "MeetingsEndpoint"),
+        "overtakes": ("openf1_client.endpoints.overtakes", "OvertakesEndpoint"),
+        "pit": ("openf1_client.endpoints.pit", "PitEndpoint"),
+        "position": ("openf1_client.endpoints.position", "PositionEndpoint"),
+        "race_control": (
+            "openf1_client.endpoints.race_control",
+            "RaceControlEndpoint",
+        ),
+        "sessions": ("openf1_client.endpoints.sessions", "SessionsEndpoint"),
+        "session_result": (
+            "openf1_client.endpoints.session_result",
+            "SessionResultEndpoint",
+        ),
+        "starting_grid": (
+            "openf1_client.endpoints.starting_grid",
+            "StartingGridEndpoint",
+        ),
+        "stints": ("openf1_client.endpoints.stints", "StintsEndpoint"),
+        "team_radio": ("openf1_client.endpoints.team_radio", "TeamRadioEndpoint"),
+        "weather": ("openf1_client.endpoints.weather", "WeatherEndpoint"),
+    }
+
     def __init__(
         self,
         username: str | None = None,
@@ -123,22 +140,20 @@ class OpenF1Client:
         Raises:
             OpenF1ConfigError: If configuration is invalid.
         """
-        # Build configuration
-        config_kwargs: dict[str, Any] = {}
-        if username is not None:
-            config_kwargs["username"] = username
-        if password is not None:
-            config_kwargs["password"] = password
-        if access_token is not None:
-            config_kwargs["access_token"] = access_token
-        if base_url is not None:
-            config_kwargs["base_url"] = base_url
-        if timeout is not None:
-            config_kwargs["timeout"] = timeout
-        if max_retries is not None:
-            config_kwargs["max_retries"] = max_retries
-        if default_format is not None:
-            config_kwargs["default_format"] = default_format
+        # Build configuration, dropping unset (None) overrides in one pass
+        config_kwargs: dict[str, Any] = {
+            key: value
+            for key, value in (
+                ("username", username),
+                ("password", password),
+                ("access_token", access_token),
+                ("base_url", base_url),
+                ("timeout", timeout),
+                ("max_retries", max_retries),
+                ("default_format", default_format),
+            )
+            if value is not None
+        }
         config_kwargs["verify_ssl"] = verify_ssl
         config_kwargs.update(extra_config)
 
@@ -148,30 +163,41 @@ class OpenF1Client:
         self._http_client = SyncHTTPClient(self._config)
         self._transport = OpenF1Transport(self._http_client, self._config)
 
-        # Initialize authentication
+        # Initialize authentication; the HTTP client reads tokens from the
+        # auth manager at send time, so the transport is never rebuilt.
         self._auth_manager = self._create_auth_manager()
+        self._http_client.bind_auth(self._auth_manager)
 
         # If we have credentials or a token, update the config with the token
         if self._config.has_credentials:
             self._setup_authenticated_client()
 
-        # Initialize endpoints (lazily)
-        self._car_data: CarDataEndpoint | None = None
-        self._drivers: DriversEndpoint | None = None
-        self._intervals: IntervalsEndpoint | None = None
-        self._laps: LapsEndpoint | None = None
-        self._location: LocationEndpoint | None = None
-        self._meetings: MeetingsEndpoint | None = None
-        self._overtakes: OvertakesEndpoint | None = None
-        self._pit: PitEndpoint | None = None
-        self._position: PositionEndpoint | None = None
-        self._race_control: RaceControlEndpoint | None = None
-        self._sessions: SessionsEndpoint | None = None
-        self._session_result: SessionResultEndpoint | None = None
-        self._starting_grid: StartingGridEndpoint | None = None
-        self._stints: StintsEndpoint | None = None
-        self._team_radio: TeamRadioEndpoint | None = None
-        self._weather: WeatherEndpoint | None = None
+    def __getattr__(self, name: str) -> Any:
+        """
+        Lazily instantiate endpoint attributes on first access.
+
+        Only fires on attribute misses, so once an endpoint is created and
+        cached on the instance, access is a plain attribute load.
+
+        Args:
+            name: The attribute name being looked up.
+
+        Returns:
+            The endpoint instance for registered endpoint names.
+
+        Raises:
+            AttributeError: If the name is not a registered endpoint.
+        """
+        target = self._ENDPOINTS.get(name)
+        if target is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        module_name, class_name = target
+        endpoint_class = getattr(importlib.import_module(module_name), class_name)
+        endpoint = endpoint_class(self._transport)
+        object.__setattr__(self, name, endpoint)
+        return endpoint
 
     def _create_auth_manager(self) -> AuthManager:
         """Create the appropriate auth manager based on configuration."""
@@ -186,7 +212,7 @@ class OpenF1Client:
                 transport=self._transport,
             )
         else:
-            provider = NoAuthProvider()
+            provider = NO_AUTH_PROVIDER
 
         return AuthManager(provider)
 
@@ -194,14 +220,10 @@ class OpenF1Client:
         """Set up authentication and update the HTTP client with the token."""
         if self._config.has_credentials and not self._config.has_token:
             try:
-                token_info = self._auth_manager.authenticate()
-                # Update config with the new token
-                self._config = self._config.with_token(token_info.access_token)
-                # Recreate HTTP client with new config
-                self._http_client.close()
-                self._http_client = SyncHTTPClient(self._config)
-                self._transport = OpenF1Transport(self._http_client, self._config)
-                logger.debug("Authentication successful, client updated with token")
+                # Warm the auth manager's token cache; requests pick the
+                # token up from the bound manager at send time.
+                self._auth_manager.authenticate()
+                logger.debug("Authentication successful, token cached")
             except Exception as e:
                 logger.warning("Failed to authenticate: %s", e)
 
@@ -228,119 +250,22 @@ class OpenF1Client:
         """
         self._setup_authenticated_client()
 
-    # Endpoint properties (lazy initialization)
-
-    @property
-    def car_data(self) -> CarDataEndpoint:
-        """Access the car telemetry data endpoint."""
-        if self._car_data is None:
-            self._car_data = CarDataEndpoint(self._transport)
-        return self._car_data
-
-    @property
-    def drivers(self) -> DriversEndpoint:
-        """Access the drivers endpoint."""
-        if self._drivers is None:
-            self._drivers = DriversEndpoint(self._transport)
-        return self._drivers
-
-    @property
-    def intervals(self) -> IntervalsEndpoint:
-        """Access the intervals/gap data endpoint."""
-        if self._intervals is None:
-            self._intervals = IntervalsEndpoint(self._transport)
-        return self._intervals
-
-    @property
-    def laps(self) -> LapsEndpoint:
-        """Access the lap timing data endpoint."""
-        if self._laps is None:
-            self._laps = LapsEndpoint(self._transport)
-        return self._laps
-
-    @property
-    def location(self) -> LocationEndpoint:
-        """Access the car location data endpoint."""
-        if self._location is None:
-            self._location = LocationEndpoint(self._transport)
-        return self._location
-
-    @property
-    def meetings(self) -> MeetingsEndpoint:
-        """Access the meetings (Grand Prix) endpoint."""
-        if self._meetings is None:
-            self._meetings = MeetingsEndpoint(self._transport)
-        return self._meetings
-
-    @property
-    def overtakes(self) -> OvertakesEndpoint:
-        """Access the overtakes endpoint (beta)."""
-        if self._overtakes is None:
-            self._overtakes = OvertakesEndpoint(self._transport)
-        return self._overtakes
-
-    @property
-    def pit(self) -> PitEndpoint:
-        """Access the pit stop data endpoint."""
-        if self._pit is None:
-            self._pit = PitEndpoint(self._transport)
-        return self._pit
-
-    @property
-    def position(self) -> PositionEndpoint:
-        """Access the driver position data endpoint."""
-        if self._position is None:
-            self._position = PositionEndpoint(self._transport)
-        return self._position
-
-    @property
-    def race_control(self) -> RaceControlEndpoint:
-        """Access the race control messages endpoint."""
-        if self._race_control is None:
-            self._race_control = RaceControlEndpoint(self._transport)
-        return self._race_control
-
-    @property
-    def sessions(self) -> SessionsEndpoint:
-        """Access the sessions endpoint."""
-        if self._sessions is None:
-            self._sessions = SessionsEndpoint(self._transport)
-        return self._sessions
-
-    @property
-    def session_result(self) -> SessionResultEndpoint:
-        """Access the session results endpoint (beta)."""
-        if self._session_result is None:
-            self._session_result = SessionResultEndpoint(self._transport)
-        return self._session_result
-
-    @property
-    def starting_grid(self) -> StartingGridEndpoint:
-        """Access the starting grid endpoint (beta)."""
-        if self._starting_grid is None:
-            self._starting_grid = StartingGridEndpoint(self._transport)
-        return self._starting_grid
-
-    @property
-    def stints(self) -> StintsEndpoint:
-        """Access the stints data endpoint."""
-        if self._stints is None:
-            self._stints = StintsEndpoint(self._transport)
-        return self._stints
-
-    @property
-    def team_radio(self) -> TeamRadioEndpoint:
-        """Access the team radio endpoint."""
-        if self._team_radio is None:
-            self._team_radio = TeamRadioEndpoint(self._transport)
-        return self._team_radio
+    def clear_cache(self) -> None:
+        """
+        Clear cached API responses.
 
-    @property
-    def weather(self) -> WeatherEndpoint:
-        """Access the weather data endpoint."""
-        if self._weather is None:
-            self._weather = WeatherEndpoint(self._transport)
-        return self._weather
+        Drops the transport's conditional-GET cache and every
+        instantiated endpoint's local caches (memoized helpers,
+        identity map, parsed responses), so subsequent requests fetch
+        fresh payloads unconditionally. Useful between live sessions.
+        """
+        self._transport.clear_cache()
+        # Duck-typed so endpoint modules stay lazily imported: anything
+        # cached on the instance with a clear_memo_cache is an endpoint.
+        for value in self.__dict__.values():
+            clear = getattr(value, "clear_memo_cache", None)
+            if clear is not None:
+                clear()
 
     def close(self) -> None:
         """
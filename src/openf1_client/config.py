@@ -7,21 +7,59 @@ including settings for authentication, timeouts, retries, and output formats.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import contextvars
+from dataclasses import dataclass, field, replace
+from importlib.metadata import PackageNotFoundError, version
 from typing import Literal
 
 from openf1_client.errors import OpenF1ConfigError
 
 
+def _package_version() -> str:
+    """Resolve the installed package version for the User-Agent header."""
+    try:
+        return version("OpenF1-python-client")
+    except PackageNotFoundError:
+        # Running from a source checkout without installation.
+        return "dev"
+
+
 # Default configuration values
 DEFAULT_BASE_URL = "https://api.openf1.org/v1"
 DEFAULT_TOKEN_URL = "https://api.openf1.org/token"
 DEFAULT_TIMEOUT = 30.0
 DEFAULT_MAX_RETRIES = 3
-DEFAULT_USER_AGENT = "openf1-python-client/1.0.0"
-
-
-@dataclass
+# Keep-alive connection-pool size for the single-host API. urllib3's
+# default of 10 would serialize part of a concurrent fan-out behind
+# fresh TLS handshakes; 32 covers the built-in helpers with headroom.
+DEFAULT_POOL_MAXSIZE = 32
+# Identifying User-Agent (API maintainers ask clients to self-identify);
+# derived from package metadata so it tracks releases automatically.
+DEFAULT_USER_AGENT = f"openf1-python-client/{_package_version()}"
+
+# When set, __post_init__ skips _validate(). Used when cloning a config
+# whose values are already known to be valid, so clones don't re-run the
+# full validation pass.
+_skip_validation: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "openf1_config_skip_validation", default=False
+)
+
+# Fields inspected by ClientConfig._validate. Clones that don't touch any
+# of these inherit validity from their already-validated source.
+_VALIDATED_FIELDS = frozenset(
+    {
+        "base_url",
+        "timeout",
+        "max_retries",
+        "username",
+        "password",
+        "default_format",
+        "pool_maxsize",
+    }
+)
+
+
+@dataclass(slots=True)
 class ClientConfig:
     """
     Configuration for the OpenF1 client.
@@ -39,6 +77,9 @@ class ClientConfig:
         password: Password for OAuth2 authentication (optional).
         access_token: Pre-existing access token (optional).
         default_format: Default response format ("json" or "csv").
+        pool_maxsize: Keep-alive connection-pool size. Raise it for
+            workloads fanning out more concurrent requests than the
+            default pool covers.
         user_agent: User-Agent header value for requests.
         extra_headers: Additional headers to include in all requests.
         verify_ssl: Whether to verify SSL certificates.
@@ -61,14 +102,33 @@ class ClientConfig:
     password: str | None = None
     access_token: str | None = None
     default_format: Literal["json", "csv"] = "json"
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE
     user_agent: str = DEFAULT_USER_AGENT
     extra_headers: dict[str, str] = field(default_factory=dict)
     verify_ssl: bool = True
-    retry_on_status: tuple[int, ...] = (500, 502, 503, 504)
+    retry_on_status: frozenset[int] | tuple[int, ...] = frozenset(
+        {500, 502, 503, 504}
+    )
+    # Derived values computed once per instance so request paths don't
+    # re-allocate or re-branch: the header dict returned by get_headers()
+    # and the resolved connect/read timeouts.
+    _headers_cache: dict[str, str] = field(init=False, repr=False, compare=False)
+    _connect_timeout: float = field(init=False, repr=False, compare=False)
+    _read_timeout: float = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
-        self._validate()
+        if not _skip_validation.get():
+            self._validate()
+        self._headers_cache = {"User-Agent": self.user_agent, **self.extra_headers}
+        # Normalize to frozenset so per-response membership checks are
+        # hashed O(1) instead of scanning a tuple.
+        if not isinstance(self.retry_on_status, frozenset):
+            self.retry_on_status = frozenset(self.retry_on_status)
+        if isinstance(self.timeout, tuple):
+            self._connect_timeout, self._read_timeout = self.timeout
+        else:
+            self._connect_timeout = self._read_timeout = self.timeout
 
     def _validate(self) -> None:
         """
@@ -80,7 +140,9 @@ class ClientConfig:
         # Validate base URL
         if not self.base_url:
             raise OpenF1ConfigError("base_url cannot be empty")
-        if not self.base_url.startswith(("http://", "https://")):
+        # Two direct slice compares beat startswith with a tuple of
+        # prefixes; this runs on every construction, including clones.
+        if self.base_url[:7] != "http://" and self.base_url[:8] != "https://":
             raise OpenF1ConfigError(
                 f"base_url must start with http:// or https://: {self.base_url}"
             )
@@ -105,6 +167,12 @@ class ClientConfig:
                 f"max_retries cannot be negative: {self.max_retries}"
             )
 
+        # Validate pool_maxsize
+        if self.pool_maxsize < 1:
+            raise OpenF1ConfigError(
+                f"pool_maxsize must be positive: {self.pool_maxsize}"
+            )
+
         # Validate auth configuration
         if (self.username is None) != (self.password is None):
             raise OpenF1ConfigError(
@@ -148,9 +216,7 @@ class ClientConfig:
         Returns:
             The connection timeout in seconds.
         """
-        if isinstance(self.timeout, tuple):
-            return self.timeout[0]
-        return self.timeout
+        return self._connect_timeout
 
     def get_read_timeout(self) -> float:
         """
@@ -159,20 +225,19 @@ class ClientConfig:
         Returns:
             The read timeout in seconds.
         """
-        if isinstance(self.timeout, tuple):
-            return self.timeout[1]
-        return self.timeout
+        return self._read_timeout
 
     def get_headers(self) -> dict[str, str]:
         """
         Get all headers to include in requests.
 
+        The returned dict is cached on the config and shared between
+        calls; treat it as read-only.
+
         Returns:
             A dictionary of headers including User-Agent and any extra headers.
         """
-        headers = {"User-Agent": self.user_agent}
-        headers.update(self.extra_headers)
-        return headers
+        return self._headers_cache
 
     def with_token(self, access_token: str) -> "ClientConfig":
         """
@@ -187,20 +252,13 @@ class ClientConfig:
         Returns:
             A new ClientConfig with the access token set.
         """
-        return ClientConfig(
-            base_url=self.base_url,
-            token_url=self.token_url,
-            timeout=self.timeout,
-            max_retries=self.max_retries,
-            username=self.username,
-            password=self.password,
-            access_token=access_token,
-            default_format=self.default_format,
-            user_agent=self.user_agent,
-            extra_headers=self.extra_headers.copy(),
-            verify_ssl=self.verify_ssl,
-            retry_on_status=self.retry_on_status,
-        )
+        # The token itself is not validated and everything else is copied
+        # from an already-validated config, so skip the validation pass.
+        reset_token = _skip_validation.set(True)
+        try:
+            return replace(self, access_token=access_token)
+        finally:
+            _skip_validation.reset(reset_token)
 
     def copy(self, **updates: object) -> "ClientConfig":
         """
@@ -212,23 +270,12 @@ class ClientConfig:
         Returns:
             A new ClientConfig with the specified updates.
         """
-        return ClientConfig(
-            base_url=updates.get("base_url", self.base_url),  # type: ignore
-            token_url=updates.get("token_url", self.token_url),  # type: ignore
-            timeout=updates.get("timeout", self.timeout),  # type: ignore
-            max_retries=updates.get("max_retries", self.max_retries),  # type: ignore
-            username=updates.get("username", self.username),  # type: ignore
-            password=updates.get("password", self.password),  # type: ignore
-            access_token=updates.get("access_token", self.access_token),  # type: ignore
-            default_format=updates.get(
-                "default_format", self.default_format
-            ),  # type: ignore
-            user_agent=updates.get("user_agent", self.user_agent),  # type: ignore
-            extra_headers=updates.get(
-                "extra_headers", self.extra_headers.copy()
-            ),  # type: ignore
-            verify_ssl=updates.get("verify_ssl", self.verify_ssl),  # type: ignore
-            retry_on_status=updates.get(
-                "retry_on_status", self.retry_on_status
-            ),  # type: ignore
-        )
+        # Only re-validate when an update touches a field _validate
+        # actually inspects; other clones inherit validity from self.
+        if _VALIDATED_FIELDS.isdisjoint(updates):
+            reset_token = _skip_validation.set(True)
+            try:
+                return replace(self, **updates)  # type: ignore[arg-type]
+            finally:
+                _skip_validation.reset(reset_token)
+        return replace(self, **updates)  # type: ignore[arg-type]
@@ -4,25 +4,34 @@ OpenF1 API Endpoints.
 This package contains endpoint classes for each OpenF1 API resource.
 Each endpoint class provides a clean interface for interacting with
 its corresponding API endpoint.
+
+Endpoint classes resolve lazily (PEP 562): the submodule for a class is
+only imported the first time the class is accessed, so scripts touching
+one or two endpoints don't pay import cost for the rest.
 """
 
-from openf1_client.endpoints.base import BaseEndpoint
-from openf1_client.endpoints.car_data import CarDataEndpoint
-from openf1_client.endpoints.drivers import DriversEndpoint
-from openf1_client.endpoints.intervals import IntervalsEndpoint
-from openf1_client.endpoints.laps import LapsEndpoint
-from openf1_client.endpoints.location import LocationEndpoint
-from openf1_client.endpoints.meetings import MeetingsEndpoint
-from openf1_client.endpoints.overtakes import OvertakesEndpoint
-from openf1_client.endpoints.pit import PitEndpoint
-from openf1_client.endpoints.position import PositionEndpoint
-from openf1_client.endpoints.race_control import RaceControlEndpoint
-from openf1_client.endpoints.sessions import SessionsEndpoint
-from openf1_client.endpoints.session_result import SessionResultEndpoint
-from openf1_client.endpoints.starting_grid import StartingGridEndpoint
-from openf1_client.endpoints.stints import StintsEndpoint
-from openf1_client.endpoints.team_radio import TeamRadioEndpoint
-from openf1_client.endpoints.weather import WeatherEndpoint
+import importlib
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from openf1_client.endpoints.base import BaseEndpoint
+    from openf1_client.endpoints.car_data import CarDataEndpoint
+    from openf1_client.endpoints.drivers import DriversEndpoint
+    from openf1_client.endpoints.intervals import IntervalsEndpoint
+    from openf1_client.endpoints.laps import LapsEndpoint
+    from openf1_client.endpoints.location import LocationEndpoint
+    from openf1_client.endpoints.meetings import MeetingsEndpoint
+    from openf1_client.endpoints.overtakes import OvertakesEndpoint
+    from openf1_client.endpoints.pit import PitEndpoint
+    from openf1_client.endpoints.position import PositionEndpoint
+    from openf1_client.endpoints.race_control import RaceControlEndpoint
+    from openf1_client.endpoints.sessions import SessionsEndpoint
+    from openf1_client.endpoints.session_result import SessionResultEndpoint
+    from openf1_client.endpoints.starting_grid import StartingGridEndpoint
+    from openf1_client.endpoints.stints import StintsEndpoint
+    from openf1_client.endpoints.team_radio import TeamRadioEndpoint
+    from openf1_client.endpoints.weather import WeatherEndpoint
 
 
 __all__ = [
@@ -44,3 +53,40 @@ __all__ = [
     "TeamRadioEndpoint",
     "WeatherEndpoint",
 ]
+
+# Class name -> defining submodule, for lazy resolution in __getattr__.
+_LAZY = {
+    "BaseEndpoint": "base",
+    "CarDataEndpoint": "car_data",
+    "DriversEndpoint": "drivers",
+    "IntervalsEndpoint": "intervals",
+    "LapsEndpoint": "laps",
+    "LocationEndpoint": "location",
+    "MeetingsEndpoint": "meetings",
+    "OvertakesEndpoint": "overtakes",
+    "PitEndpoint": "pit",
+    "PositionEndpoint": "position",
+    "RaceControlEndpoint": "race_control",
+    "SessionsEndpoint": "sessions",
+    "SessionResultEndpoint": "session_result",
+    "StartingGridEndpoint": "starting_grid",
+    "StintsEndpoint": "stints",
+    "TeamRadioEndpoint": "team_radio",
+    "WeatherEndpoint": "weather",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import and cache endpoint classes on first access (PEP 562)."""
+    submodule = _LAZY.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"openf1_client.endpoints.{submodule}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazy exports in dir(openf1_client.endpoints)."""
+    return sorted(set(globals()) | set(_LAZY))
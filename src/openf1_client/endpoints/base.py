@@ -7,13 +7,34 @@ with common functionality for fetching and parsing data.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar
-
-from pydantic import ValidationError
-
-from openf1_client.errors import OpenF1ValidationError
+import csv
+import functools
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import attrgetter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Generic,
+    Iterator,
+    Literal,
+    Sequence,
+    TypeVar,
+)
+
+from pydantic import TypeAdapter, ValidationError
+
+from openf1_client.errors import OpenF1NotFoundError, OpenF1ValidationError
 from openf1_client.models import OpenF1BaseModel
-from openf1_client.utils import FilterValue, parse_csv_response
+from openf1_client.utils import FilterValue
 
 
 if TYPE_CHECKING:
@@ -22,6 +43,70 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound=OpenF1BaseModel)
 
+# Upper bound on per-endpoint identity-cache entries. 4096 laps is about
+# 3 full race weekends of timing data; beyond that the least recently
+# used records are evicted.
+_IDENTITY_CACHE_SIZE = 4096
+
+# Set OPENF1_STRICT=1 to force full pydantic validation even on
+# endpoints that trust the server contract (read once at import).
+_STRICT = os.environ.get("OPENF1_STRICT", "").lower() in {"1", "true", "yes"}
+
+# Freshness window and size bound for the per-endpoint parsed-response
+# cache consulted by list() before going to the network.
+_RESPONSE_CACHE_TTL = 30.0
+_RESPONSE_CACHE_SIZE = 128
+
+
+def _memoize_ttl(
+    seconds: float = 30.0,
+    maxsize: int = 128,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Memoize an endpoint helper per instance with a TTL and LRU bound.
+
+    Repeat calls with the same arguments within the TTL return the cached
+    result instead of re-issuing the HTTP request and re-parsing the
+    payload. Calls involving the "latest" alias bypass the cache since
+    their answer changes as sessions progress, as do calls with
+    unhashable arguments.
+
+    Args:
+        seconds: How long a cached result stays fresh.
+        maxsize: Maximum entries kept per endpoint instance.
+
+    Returns:
+        The decorator to apply to an endpoint method.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(self: "BaseEndpoint[Any]", *args: Any, **kwargs: Any) -> Any:
+            if "latest" in args or "latest" in kwargs.values():
+                return func(self, *args, **kwargs)
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            cache = self._memo_cache
+            now = time.monotonic()
+            try:
+                with self._cache_lock:
+                    entry = cache.get(key)
+                    if entry is not None and now < entry[0]:
+                        cache.move_to_end(key)
+                        return entry[1]
+            except TypeError:
+                return func(self, *args, **kwargs)
+            result = func(self, *args, **kwargs)
+            with self._cache_lock:
+                cache[key] = (now + seconds, result)
+                cache.move_to_end(key)
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return result
+
+        return wrapper
+
+    return decorator
+
 
 class BaseEndpoint(Generic[T]):
     """
@@ -41,6 +126,75 @@ class BaseEndpoint(Generic[T]):
 
     _endpoint: str = ""
     _model_class: type[T]
+    _FILTERS: ClassVar[tuple[str, ...]] = ()
+    # Natural-key fields for the identity cache. Endpoints that declare
+    # these get point lookups served from previously fetched rows.
+    _identity_fields: ClassVar[tuple[str, ...]] = ()
+    # High-volume endpoints set this to skip per-row validation in
+    # list(), building models with model_construct instead. Overridden
+    # globally by the OPENF1_STRICT environment variable.
+    _trust_server: ClassVar[bool] = False
+    # Compact per-column dtypes for list_columns(); endpoints with
+    # known value ranges override this to shrink the arrays.
+    _COLUMN_DTYPES: ClassVar[dict[str, str]] = {}
+    _list_adapter: ClassVar[TypeAdapter[Any]]
+    _model_validate: ClassVar[Any]
+    _model_name: ClassVar[str]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Build the batch list validator for concrete endpoint subclasses.
+
+        A single TypeAdapter(list[model]) call validates a whole response
+        inside pydantic-core, instead of one model_validate call (and
+        try/except setup) per row.
+        """
+        super().__init_subclass__(**kwargs)
+        # Interning the endpoint path lets every URL build and dict-key
+        # comparison reuse one string object.
+        if cls.__dict__.get("_endpoint"):
+            cls._endpoint = sys.intern(cls._endpoint)
+        if cls._FILTERS and "list" not in cls.__dict__:
+            cls._generate_list()
+        model_class = getattr(cls, "_model_class", None)
+        if model_class is not None:
+            cls._list_adapter = TypeAdapter(list[model_class])  # type: ignore[valid-type]
+            # Pre-bound validator and cached name keep attribute lookups
+            # off the per-item parse and error-formatting paths.
+            cls._model_validate = model_class.model_validate
+            cls._model_name = model_class.__name__
+
+    @classmethod
+    def _generate_list(cls) -> None:
+        """
+        Generate a concrete list() from the declared _FILTERS tuple.
+
+        The generated function binds the declared filter names as real
+        keyword parameters (compiled once per class), so calls dispatch
+        through argument binding in C rather than a hand-written
+        pass-through frame, and assembles the filter dict inline from
+        locals — no intermediate kwargs dict and no _build_filters scan.
+        TYPE_CHECKING-only stubs in the subclasses keep the richer
+        annotations and docstrings for static tooling.
+        """
+        args = ", ".join(f"{name}=None" for name in cls._FILTERS)
+        assigns = "\n".join(
+            f"    if {name} is not None:\n        filters[{name!r}] = {name}"
+            for name in cls._FILTERS
+        )
+        source = (
+            f"def list(self, {args}, **extra_filters):\n"
+            f"    filters = extra_filters\n"
+            f"{assigns}\n"
+            f"    return self._fetch_prepared(filters)\n"
+        )
+        namespace: dict[str, Any] = {}
+        exec(source, namespace)  # noqa: S102
+        generated = namespace["list"]
+        generated.__qualname__ = f"{cls.__name__}.list"
+        generated.__module__ = cls.__module__
+        generated.__doc__ = BaseEndpoint.list.__doc__
+        cls.list = generated
 
     def __init__(self, transport: "OpenF1Transport") -> None:
         """
@@ -50,6 +204,92 @@ class BaseEndpoint(Generic[T]):
             transport: The transport layer for making HTTP requests.
         """
         self._transport = transport
+        # TTL+LRU store used by helpers decorated with _memoize_ttl.
+        self._memo_cache: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        # Natural-key -> model map populated opportunistically from
+        # list() results, so point lookups like get_lap() can answer
+        # from rows that already crossed the wire.
+        self._identity_cache: OrderedDict[tuple[Any, ...], T] = OrderedDict()
+        # Request-key -> parsed list, so identical list() calls within
+        # the freshness window skip the round-trip entirely.
+        self._response_cache: OrderedDict[str, tuple[float, list[T]]] = OrderedDict()
+        self._in_flight: dict[str, Future[list[T]]] = {}
+        self._in_flight_lock = threading.Lock()
+        # Guards the three caches above: list_many/list_parallel drive
+        # them from a thread pool, and an unsynchronized get ->
+        # move_to_end against a concurrent eviction raises KeyError.
+        # Never held across an HTTP fetch.
+        self._cache_lock = threading.Lock()
+
+    def clear_memo_cache(self) -> None:
+        """Drop all cached helper results, identities, and responses."""
+        with self._cache_lock:
+            self._memo_cache.clear()
+            self._identity_cache.clear()
+            self._response_cache.clear()
+
+    def invalidate(self, session_key: int | str | None = None) -> None:
+        """
+        Drop cached rows, optionally only for one session.
+
+        Memoized helper results are dropped wholesale either way, since
+        their keys don't carry the session in a fixed position.
+
+        Args:
+            session_key: If given, only identity-cache entries for this
+                session are removed; otherwise both caches are cleared.
+        """
+        if session_key is None:
+            self.clear_memo_cache()
+            return
+        with self._cache_lock:
+            self._memo_cache.clear()
+            fields = self._identity_fields
+            if "session_key" in fields:
+                position = fields.index("session_key")
+                cache = self._identity_cache
+                for key in [k for k in cache if k[position] == session_key]:
+                    del cache[key]
+            else:
+                self._identity_cache.clear()
+
+    def _identity_get(self, key: tuple[Any, ...]) -> T | None:
+        """
+        Look up a previously fetched record by natural key.
+
+        Args:
+            key: The record's natural-key values, in _identity_fields order.
+
+        Returns:
+            The cached model instance, or None on a miss.
+        """
+        with self._cache_lock:
+            model = self._identity_cache.get(key)
+            if model is not None:
+                self._identity_cache.move_to_end(key)
+        return model
+
+    def _cache_identities(self, models: list[T]) -> None:
+        """
+        Record fetched models in the identity cache by natural key.
+
+        Rows with an incomplete key (missing field values) are skipped;
+        the cache is bounded by LRU eviction.
+
+        Args:
+            models: Validated model instances from a list() response.
+        """
+        cache = self._identity_cache
+        fields = self._identity_fields
+        with self._cache_lock:
+            for model in models:
+                key = tuple(getattr(model, name, None) for name in fields)
+                if None in key:
+                    continue
+                cache[key] = model
+                cache.move_to_end(key)
+            while len(cache) > _IDENTITY_CACHE_SIZE:
+                cache.popitem(last=False)
 
     def _build_filters(self, **kwargs: FilterValue | None) -> dict[str, FilterValue]:
         """
@@ -63,7 +303,13 @@ class BaseEndpoint(Generic[T]):
         Returns:
             A dictionary of non-None filter values.
         """
-        return {k: v for k, v in kwargs.items() if v is not None}
+        # Callers usually pass exactly the filters they want, so the
+        # common case has nothing to drop; return the kwargs dict itself
+        # (fresh per call) instead of rebuilding it.
+        for value in kwargs.values():
+            if value is None:
+                return {k: v for k, v in kwargs.items() if v is not None}
+        return kwargs
 
     def _fetch_list(self, **filters: FilterValue | None) -> list[T]:
         """
@@ -79,9 +325,171 @@ class BaseEndpoint(Generic[T]):
             OpenF1ValidationError: If response data fails validation.
             OpenF1APIError: If the API returns an error.
         """
-        clean_filters = self._build_filters(**filters)
-        data = self._transport.fetch_json(self._endpoint, clean_filters)
-        return self._parse_response(data)
+        return self._fetch_prepared(self._build_filters(**filters))
+
+    def _fetch_prepared(self, clean_filters: dict[str, FilterValue]) -> list[T]:
+        """
+        Fetch and parse a list using an already-cleaned filter dict.
+
+        Shared tail of _fetch_list and the generated per-class list(),
+        which builds its filter dict inline and skips _build_filters.
+
+        Recognizes two meta-kwargs that are applied locally rather than
+        sent to the API (which has no ordering or limit parameters):
+        _order_by sorts the result by the named field (None values
+        last), _limit truncates it.
+
+        Args:
+            clean_filters: Filter parameters with None values removed.
+
+        Returns:
+            A list of model instances.
+
+        Raises:
+            OpenF1ValidationError: If response data fails validation.
+            OpenF1APIError: If the API returns an error.
+        """
+        order_by = clean_filters.pop("_order_by", None)
+        limit = clean_filters.pop("_limit", None)
+        # Swap the "latest" alias for the concrete session key (resolved
+        # once per TTL on the transport) so local and HTTP caches can
+        # match the request. The sessions endpoint resolves it natively.
+        resolved_latest = False
+        if (
+            clean_filters.get("session_key") == "latest"
+            and self._endpoint != "sessions"
+        ):
+            resolved = self._transport.resolve_latest_session()
+            if resolved is not None:
+                clean_filters["session_key"] = resolved
+                resolved_latest = True
+        # Identical calls inside the freshness window are answered from
+        # the parsed-response cache; requests still carrying the
+        # "latest" alias bypass it, as their answer shifts over time.
+        cache_key: str | None = None
+        if "latest" not in clean_filters.values():
+            canonical = json.dumps(
+                {"endpoint": self._endpoint, **clean_filters},
+                sort_keys=True,
+                default=str,
+            )
+            cache_key = hashlib.sha256(canonical.encode()).hexdigest()
+            with self._cache_lock:
+                entry = self._response_cache.get(cache_key)
+                if entry is not None and time.monotonic() < entry[0]:
+                    self._response_cache.move_to_end(cache_key)
+                else:
+                    entry = None
+            if entry is not None:
+                return self._order_and_limit(entry[1], order_by, limit)
+            # Coalesce concurrent duplicates: the first caller issues
+            # the HTTP request, later identical calls (e.g. dashboard
+            # components polling in the same tick) wait on its Future
+            # instead of racing a second fetch.
+            with self._in_flight_lock:
+                pending = self._in_flight.get(cache_key)
+                if pending is None:
+                    future: Future[list[T]] = Future()
+                    self._in_flight[cache_key] = future
+            if pending is not None:
+                return self._order_and_limit(pending.result(), order_by, limit)
+        # Caching steps stay inside the try: if anything between the
+        # fetch and set_result fails, the exception must reach the
+        # Future or coalesced waiters would block on result() forever.
+        try:
+            data = self._transport.fetch_json(self._endpoint, clean_filters)
+            models = self._parse_response(data)
+            if self._identity_fields and models:
+                self._cache_identities(models)
+            if cache_key is not None:
+                with self._cache_lock:
+                    self._response_cache[cache_key] = (
+                        time.monotonic() + _RESPONSE_CACHE_TTL,
+                        models,
+                    )
+                    self._response_cache.move_to_end(cache_key)
+                    if len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+                        self._response_cache.popitem(last=False)
+        except BaseException as exc:
+            # A 404 against a substituted "latest" key means the
+            # session rolled over inside the resolution TTL; drop the
+            # stale key so the next aliased call re-resolves.
+            if resolved_latest and isinstance(exc, OpenF1NotFoundError):
+                self._transport.invalidate_latest_session()
+            if cache_key is not None:
+                with self._in_flight_lock:
+                    self._in_flight.pop(cache_key, None)
+                future.set_exception(exc)
+            raise
+        if cache_key is not None:
+            with self._in_flight_lock:
+                self._in_flight.pop(cache_key, None)
+            future.set_result(models)
+        return self._order_and_limit(models, order_by, limit)
+
+    def _cached_list(self, **clean_filters: FilterValue) -> list[T] | None:
+        """
+        Return a still-fresh cached result for the given filters, if any.
+
+        Lets point-lookup helpers answer from a broader query already in
+        the response cache (e.g. a full-session fetch) instead of
+        issuing their own narrower request. Read-only: a miss does not
+        trigger a fetch.
+
+        Args:
+            **clean_filters: Filter parameters exactly as a prior list()
+                call would have sent them (no None values).
+
+        Returns:
+            The cached model list, or None if absent or expired.
+        """
+        canonical = json.dumps(
+            {"endpoint": self._endpoint, **clean_filters},
+            sort_keys=True,
+            default=str,
+        )
+        key = hashlib.sha256(canonical.encode()).hexdigest()
+        with self._cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is not None and time.monotonic() < entry[0]:
+                return entry[1]
+        return None
+
+    @staticmethod
+    def _order_and_limit(
+        models: list[T],
+        order_by: Any,
+        limit: Any,
+    ) -> list[T]:
+        """
+        Apply local ordering and truncation to a result list.
+
+        Sorting uses attrgetter, a C-level key callable, after
+        partitioning rows whose sort field is None to the back; rows
+        are never mutated and the input list is left intact (it may be
+        shared via the response cache). The API often returns rows
+        already in the requested order (e.g. stints per driver), so a
+        linear verify pass skips the sort entirely when it would be a
+        no-op.
+
+        Args:
+            models: The parsed result list.
+            order_by: Field name to sort by, or None to keep API order.
+            limit: Maximum rows to return, or None for all.
+
+        Returns:
+            The ordered, truncated list (the input list if untouched).
+        """
+        if order_by is not None:
+            keys = [getattr(m, order_by, None) for m in models]
+            if None in keys or any(a > b for a, b in zip(keys, keys[1:])):
+                keyed = [m for m, k in zip(models, keys) if k is not None]
+                missing = [m for m, k in zip(models, keys) if k is None]
+                keyed.sort(key=attrgetter(order_by))
+                models = keyed + missing
+        if limit is not None:
+            models = models[:limit]
+        return models
 
     def list(self, **filters: FilterValue | None) -> list[T]:
         """
@@ -99,6 +507,124 @@ class BaseEndpoint(Generic[T]):
         """
         return self._fetch_list(**filters)
 
+    def list_many(
+        self,
+        filter_sets: list[dict[str, FilterValue | None]],
+        max_workers: int = 8,
+    ) -> list[list[T]]:
+        """
+        Run several independent list() queries concurrently.
+
+        N queries complete in roughly the latency of the slowest one
+        instead of their sum, since the round-trips overlap on a thread
+        pool (the underlying requests session pools connections across
+        threads).
+
+        Args:
+            filter_sets: One filter dict per query, as passed to list().
+            max_workers: Upper bound on concurrent requests.
+
+        Returns:
+            One result list per filter set, in input order.
+
+        Raises:
+            OpenF1ValidationError: If any response fails validation.
+            OpenF1APIError: If any query returns an error.
+        """
+        if not filter_sets:
+            return []
+        if len(filter_sets) == 1:
+            return [self.list(**filter_sets[0])]
+        workers = min(max_workers, len(filter_sets))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda fs: self.list(**fs), filter_sets))
+
+    def for_meeting(self, meeting_key: int | str) -> dict[int, list[T]]:
+        """
+        Fetch a whole meeting's records, grouped by session.
+
+        One meeting-wide request partitioned locally replaces a
+        per-session loop: N round-trips collapse to 1, and the single
+        larger payload compresses better than N small ones.
+
+        Args:
+            meeting_key: The meeting identifier (or "latest").
+
+        Returns:
+            session_key -> records for that session, preserving response
+            order within each session.
+        """
+        grouped: dict[int, list[T]] = {}
+        for record in self.list(meeting_key=meeting_key):
+            key = getattr(record, "session_key", None)
+            if key is None:
+                continue
+            grouped.setdefault(key, []).append(record)
+        return grouped
+
+    def list_parallel(
+        self,
+        session_key: int | str,
+        total_laps: int,
+        shards: int = 4,
+    ) -> list[T]:
+        """
+        Fetch a whole session as concurrent lap-ranged shards.
+
+        Splits the lap range into `shards` slices fetched in parallel,
+        so the server produces and transmits the shards concurrently
+        instead of one large blob. Only useful on endpoints with a
+        lap_number field; rows without one (e.g. pre-race race control
+        messages) fall outside every shard and are not returned.
+
+        Args:
+            session_key: The session identifier.
+            total_laps: The session's lap count (see LapsEndpoint.count).
+            shards: Number of concurrent slices.
+
+        Returns:
+            The concatenated model instances, in lap order.
+
+        Raises:
+            OpenF1ValidationError: If any response fails validation.
+            OpenF1APIError: If any shard returns an error.
+        """
+        if shards <= 1 or total_laps <= shards:
+            return self.list(session_key=session_key)
+        span = -(-total_laps // shards)
+        filter_sets: list[dict[str, FilterValue | None]] = [
+            {
+                "session_key": session_key,
+                "lap_number": {">=": low, "<=": min(low + span - 1, total_laps)},
+            }
+            for low in range(1, total_laps + 1, span)
+        ]
+        results = self.list_many(filter_sets)
+        return [row for shard in results for row in shard]
+
+    def list_unchecked(self, **filters: FilterValue | None) -> list[T]:
+        """
+        Fetch records without running pydantic validation.
+
+        Builds models with model_construct, which assigns fields directly
+        instead of validating and coercing each one. Assumes the API
+        response conforms to the model schema; prefer list() when the
+        data will be handed to code that relies on coerced types.
+
+        Args:
+            **filters: Filter parameters to apply.
+
+        Returns:
+            A list of unvalidated model instances.
+
+        Raises:
+            OpenF1APIError: If the API returns an error.
+        """
+        clean_filters = self._build_filters(**filters)
+        data = self._transport.fetch_json(self._endpoint, clean_filters)
+        construct = self._model_class.model_construct
+        return [construct(**item) for item in data]
+
     def list_raw(
         self,
         format: Literal["json", "csv"] | None = None,
@@ -144,8 +670,156 @@ class BaseEndpoint(Generic[T]):
         Returns:
             A list of dictionaries parsed from CSV.
         """
-        csv_text = self.list_csv(**filters)
-        return parse_csv_response(csv_text)
+        # Stream the response straight into the CSV reader so the full
+        # text and the parsed rows never coexist in memory.
+        clean_filters = self._build_filters(**filters)
+        lines = self._transport.iter_csv(self._endpoint, clean_filters)
+        return list(csv.DictReader(lines))
+
+    def iter(self, **filters: FilterValue | None) -> Iterator[T]:
+        """
+        Iterate over records without materializing the full response.
+
+        Streams the response as CSV and validates one row at a time, so
+        peak memory stays near a single row regardless of payload size.
+        Intended for high-volume endpoints (location, car_data, position)
+        where a session can return tens of thousands of rows; prefer
+        list() when the whole result set is needed anyway, since batch
+        validation is faster per row.
+
+        Args:
+            **filters: Filter parameters to apply.
+
+        Yields:
+            Validated model instances, one per response row.
+
+        Raises:
+            OpenF1ValidationError: If a row fails validation.
+            OpenF1APIError: If the API returns an error.
+        """
+        clean_filters = self._build_filters(**filters)
+        lines = self._transport.iter_csv(self._endpoint, clean_filters)
+        for row in csv.DictReader(lines):
+            # CSV has no null literal; empty cells come back as "" and
+            # must map to None before validation.
+            yield self._parse_single(
+                {key: (value if value != "" else None) for key, value in row.items()}
+            )
+
+    def list_fields(
+        self,
+        fields: Sequence[str],
+        **filters: FilterValue | None,
+    ) -> list[dict[str, str | None]]:
+        """
+        Fetch only the named columns as plain dicts.
+
+        Streams the response as CSV and keeps just the requested fields
+        per row, skipping model construction entirely. The OpenF1 API
+        has no server-side field selection, so full rows still cross the
+        wire, but the parse and allocation cost drops to the projected
+        columns.
+
+        Args:
+            fields: Column names to keep (e.g., ["driver_number", "date"]).
+            **filters: Filter parameters to apply.
+
+        Returns:
+            One dict per row with the requested fields; empty CSV cells
+            are returned as None, missing columns are dropped.
+        """
+        clean_filters = self._build_filters(**filters)
+        lines = self._transport.iter_csv(self._endpoint, clean_filters)
+        return [
+            {name: (row[name] or None) for name in fields if name in row}
+            for row in csv.DictReader(lines)
+        ]
+
+    def list_field(
+        self,
+        field: str,
+        **filters: FilterValue | None,
+    ) -> list[str | None]:
+        """
+        Fetch a single column as a flat list.
+
+        Single-field form of list_fields for helpers that read exactly
+        one attribute per row (a compound name, a recording URL): no
+        model objects and no per-row dicts are built.
+
+        Args:
+            field: The column name to extract.
+            **filters: Filter parameters to apply.
+
+        Returns:
+            The column's values in row order; empty CSV cells are
+            returned as None. Empty if the column does not exist.
+        """
+        clean_filters = self._build_filters(**filters)
+        lines = self._transport.iter_csv(self._endpoint, clean_filters)
+        return [row[field] or None for row in csv.DictReader(lines) if field in row]
+
+    def list_columns(
+        self,
+        **filters: FilterValue | None,
+    ) -> dict[str, Any]:
+        """
+        Fetch records as columnar NumPy arrays instead of model objects.
+
+        Fetches the CSV representation and parses it straight into one
+        array per field, skipping pydantic entirely. For plotting or
+        vectorized analysis this avoids building tens of thousands of
+        model objects only to immediately convert them back into arrays.
+
+        Requires the optional numpy dependency
+        (``pip install openf1-client[numpy]``).
+
+        Args:
+            **filters: Filter parameters to apply.
+
+        Returns:
+            A dict mapping column names to NumPy arrays. Columns listed
+            in the endpoint's _COLUMN_DTYPES use those compact dtypes;
+            timestamp columns are datetime64[ms]; the rest fall back to
+            float or object arrays.
+
+        Raises:
+            ImportError: If numpy is not installed.
+            OpenF1APIError: If the API returns an error.
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError(
+                "list_columns requires numpy; install it with "
+                "'pip install openf1-client[numpy]'"
+            ) from e
+
+        rows = self.list_csv_parsed(**filters)
+        if not rows:
+            return {}
+
+        columns: dict[str, Any] = {}
+        for name in rows[0]:
+            values = [row.get(name) for row in rows]
+            dtype = self._COLUMN_DTYPES.get(name)
+            if dtype is None and name.startswith("date"):
+                dtype = "datetime64[ms]"
+            # Declared dtypes are best-effort: a None cell in an
+            # integer column, or a tz-offset timestamp numpy rejects,
+            # degrades the column to float64 (NaN for missing values)
+            # and finally to object rather than raising.
+            if dtype is not None:
+                try:
+                    columns[name] = np.asarray(values, dtype=dtype)
+                    continue
+                except (TypeError, ValueError):
+                    pass
+            try:
+                columns[name] = np.asarray(values, dtype=np.float64)
+            except (TypeError, ValueError):
+                columns[name] = np.asarray(values, dtype=object)
+        return columns
 
     def first(self, **filters: FilterValue | None) -> T | None:
         """
@@ -157,15 +831,24 @@ class BaseEndpoint(Generic[T]):
         Returns:
             The first matching model instance, or None if no matches.
         """
-        results = self.list(**filters)
-        return results[0] if results else None
+        # Only the first row is materialized as a model; the rest of the
+        # payload skips pydantic validation entirely. (The OpenF1 API has
+        # no limit parameter, so the fetch itself cannot be narrowed.)
+        clean_filters = self._build_filters(**filters)
+        data = self._transport.fetch_json(self._endpoint, clean_filters)
+        if not data:
+            return None
+        return self._parse_single(data[0])
 
     def count(self, **filters: FilterValue | None) -> int:
         """
         Count matching records.
 
         Note: This fetches all records and counts them locally.
-        The OpenF1 API doesn't provide a dedicated count endpoint.
+        The OpenF1 API doesn't provide a dedicated count endpoint, so
+        the records are requested as CSV and counted by line, which
+        avoids tokenizing the payload into JSON objects just to take
+        its length.
 
         Args:
             **filters: Filter parameters to apply.
@@ -174,8 +857,14 @@ class BaseEndpoint(Generic[T]):
             The number of matching records.
         """
         clean_filters = self._build_filters(**filters)
-        data = self._transport.fetch_json(self._endpoint, clean_filters)
-        return len(data)
+        csv_text = self._transport.fetch_csv(self._endpoint, clean_filters)
+        if not csv_text:
+            return 0
+        line_count = csv_text.count("\n")
+        if not csv_text.endswith("\n"):
+            line_count += 1
+        # The first line is the CSV header.
+        return max(line_count - 1, 0)
 
     def _parse_response(self, data: list[dict[str, Any]]) -> list[T]:
         """
@@ -190,17 +879,25 @@ class BaseEndpoint(Generic[T]):
         Raises:
             OpenF1ValidationError: If validation fails.
         """
-        results: list[T] = []
-        for item in data:
-            try:
-                results.append(self._model_class.model_validate(item))
-            except ValidationError as e:
-                raise OpenF1ValidationError(
-                    message=f"Failed to validate {self._model_class.__name__}",
-                    field=str(e.errors()[0]["loc"]) if e.errors() else None,
-                    value=item,
-                ) from e
-        return results
+        if not data:
+            return []
+        if self._trust_server and not _STRICT:
+            # The OpenF1 payload for these endpoints is a stable,
+            # well-typed contract; assigning fields directly avoids the
+            # dominant per-row validation cost at 3.7 Hz data volumes.
+            construct = self._model_class.model_construct
+            return [construct(**item) for item in data]
+        try:
+            return self._list_adapter.validate_python(data)
+        except ValidationError as e:
+            errors = e.errors()
+            loc = errors[0]["loc"] if errors else ()
+            index = loc[0] if loc and isinstance(loc[0], int) else None
+            raise OpenF1ValidationError(
+                message=f"Failed to validate {self._model_name}",
+                field=str(loc[1:]) if len(loc) > 1 else None,
+                value=data[index] if index is not None and index < len(data) else None,
+            ) from e
 
     def _parse_single(self, data: dict[str, Any]) -> T:
         """
@@ -216,10 +913,10 @@ class BaseEndpoint(Generic[T]):
             OpenF1ValidationError: If validation fails.
         """
         try:
-            return self._model_class.model_validate(data)
+            return self._model_validate(data)
         except ValidationError as e:
             raise OpenF1ValidationError(
-                message=f"Failed to validate {self._model_class.__name__}",
+                message=f"Failed to validate {self._model_name}",
                 field=str(e.errors()[0]["loc"]) if e.errors() else None,
                 value=data,
             ) from e
@@ -7,6 +7,8 @@ speed, RPM, throttle, brake, and DRS status.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from openf1_client.endpoints.base import BaseEndpoint
 from openf1_client.models import CarData
 from openf1_client.utils import FilterValue
@@ -43,52 +45,70 @@ class CarDataEndpoint(BaseEndpoint[CarData]):
     _endpoint = "car_data"
     _model_class = CarData
 
-    def list(
-        self,
-        session_key: int | str | None = None,
-        meeting_key: int | str | None = None,
-        driver_number: int | None = None,
-        date: FilterValue | None = None,
-        speed: FilterValue | None = None,
-        rpm: FilterValue | None = None,
-        n_gear: FilterValue | None = None,
-        throttle: FilterValue | None = None,
-        brake: FilterValue | None = None,
-        drs: FilterValue | None = None,
-        **extra_filters: FilterValue | None,
-    ) -> list[CarData]:
-        """
-        Fetch car telemetry data.
-
-        Args:
-            session_key: Filter by session (use "latest" for current session).
-            meeting_key: Filter by meeting (use "latest" for current meeting).
-            driver_number: Filter by driver number.
-            date: Filter by timestamp (supports comparison operators).
-            speed: Filter by speed in km/h (supports comparison operators).
-            rpm: Filter by engine RPM (supports comparison operators).
-            n_gear: Filter by gear (0-8).
-            throttle: Filter by throttle percentage (0-100).
-            brake: Filter by brake percentage (0-100).
-            drs: Filter by DRS status.
-            **extra_filters: Additional filter parameters.
-
-        Returns:
-            List of CarData instances.
-        """
-        return super().list(
-            session_key=session_key,
-            meeting_key=meeting_key,
-            driver_number=driver_number,
-            date=date,
-            speed=speed,
-            rpm=rpm,
-            n_gear=n_gear,
-            throttle=throttle,
-            brake=brake,
-            drs=drs,
-            **extra_filters,
-        )
+    # Compact dtypes for the known telemetry channels; chosen to cover
+    # their value ranges (speed/rpm fit uint16, percentages fit uint8).
+    _COLUMN_DTYPES = {
+        "speed": "uint16",
+        "rpm": "uint16",
+        "n_gear": "int8",
+        "throttle": "uint8",
+        "brake": "uint8",
+        "drs": "uint8",
+        "driver_number": "uint8",
+        "session_key": "int64",
+        "meeting_key": "int64",
+    }
+
+    _FILTERS = (
+        "session_key",
+        "meeting_key",
+        "driver_number",
+        "date",
+        "speed",
+        "rpm",
+        "n_gear",
+        "throttle",
+        "brake",
+        "drs",
+    )
+
+    if TYPE_CHECKING:
+        # Typed stub only: at runtime list() resolves to BaseEndpoint.list,
+        # avoiding a pass-through frame and kwargs copy per call.
+        def list(
+            self,
+            session_key: int | str | None = None,
+            meeting_key: int | str | None = None,
+            driver_number: int | None = None,
+            date: FilterValue | None = None,
+            speed: FilterValue | None = None,
+            rpm: FilterValue | None = None,
+            n_gear: FilterValue | None = None,
+            throttle: FilterValue | None = None,
+            brake: FilterValue | None = None,
+            drs: FilterValue | None = None,
+            **extra_filters: FilterValue | None,
+        ) -> list[CarData]:
+            """
+            Fetch car telemetry data.
+
+            Args:
+                session_key: Filter by session (use "latest" for current session).
+                meeting_key: Filter by meeting (use "latest" for current meeting).
+                driver_number: Filter by driver number.
+                date: Filter by timestamp (supports comparison operators).
+                speed: Filter by speed in km/h (supports comparison operators).
+                rpm: Filter by engine RPM (supports comparison operators).
+                n_gear: Filter by gear (0-8).
+                throttle: Filter by throttle percentage (0-100).
+                brake: Filter by brake percentage (0-100).
+                drs: Filter by DRS status.
+                **extra_filters: Additional filter parameters.
+
+            Returns:
+                List of CarData instances.
+            """
+            ...
 
     def get_high_speed_moments(
         self,
@@ -110,7 +130,9 @@ class CarDataEndpoint(BaseEndpoint[CarData]):
         Returns:
             List of CarData instances exceeding the speed threshold.
         """
-        return self.list(
+        # Server-side filtering already guarantees the shape of the rows,
+        # so skip validation on this bulk telemetry path.
+        return self.list_unchecked(
             session_key=session_key,
             driver_number=driver_number,
             speed={">=": min_speed},
@@ -133,7 +155,7 @@ class CarDataEndpoint(BaseEndpoint[CarData]):
         Returns:
             List of CarData instances with DRS active.
         """
-        return self.list(
+        return self.list_unchecked(
             session_key=session_key,
             driver_number=driver_number,
             drs={">=": 10},
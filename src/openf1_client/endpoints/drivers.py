@@ -6,6 +6,8 @@ Provides access to driver information for each session.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from openf1_client.endpoints.base import BaseEndpoint
 from openf1_client.models import Driver
 from openf1_client.utils import FilterValue
@@ -33,40 +35,44 @@ class DriversEndpoint(BaseEndpoint[Driver]):
     _endpoint = "drivers"
     _model_class = Driver
 
-    def list(
-        self,
-        session_key: int | str | None = None,
-        meeting_key: int | str | None = None,
-        driver_number: int | None = None,
-        name_acronym: str | None = None,
-        team_name: str | None = None,
-        country_code: str | None = None,
-        **extra_filters: FilterValue | None,
-    ) -> list[Driver]:
-        """
-        Fetch driver information.
-
-        Args:
-            session_key: Filter by session (use "latest" for current session).
-            meeting_key: Filter by meeting (use "latest" for current meeting).
-            driver_number: Filter by driver number (1-99).
-            name_acronym: Filter by three-letter acronym (e.g., "VER", "HAM").
-            team_name: Filter by team name.
-            country_code: Filter by nationality ISO code.
-            **extra_filters: Additional filter parameters.
-
-        Returns:
-            List of Driver instances.
-        """
-        return super().list(
-            session_key=session_key,
-            meeting_key=meeting_key,
-            driver_number=driver_number,
-            name_acronym=name_acronym,
-            team_name=team_name,
-            country_code=country_code,
-            **extra_filters,
-        )
+    _FILTERS = (
+        "session_key",
+        "meeting_key",
+        "driver_number",
+        "name_acronym",
+        "team_name",
+        "country_code",
+    )
+
+    if TYPE_CHECKING:
+        # Typed stub only: at runtime list() resolves to BaseEndpoint.list,
+        # avoiding a pass-through frame and kwargs copy per call.
+        def list(
+            self,
+            session_key: int | str | None = None,
+            meeting_key: int | str | None = None,
+            driver_number: int | None = None,
+            name_acronym: str | None = None,
+            team_name: str | None = None,
+            country_code: str | None = None,
+            **extra_filters: FilterValue | None,
+        ) -> list[Driver]:
+            """
+            Fetch driver information.
+
+            Args:
+                session_key: Filter by session (use "latest" for current session).
+                meeting_key: Filter by meeting (use "latest" for current meeting).
+                driver_number: Filter by driver number (1-99).
+                name_acronym: Filter by three-letter acronym (e.g., "VER", "HAM").
+                team_name: Filter by team name.
+                country_code: Filter by nationality ISO code.
+                **extra_filters: Additional filter parameters.
+
+            Returns:
+                List of Driver instances.
+            """
+            ...
 
     def get_by_number(
         self,
@@ -100,7 +106,11 @@ class DriversEndpoint(BaseEndpoint[Driver]):
         Returns:
             The Driver instance, or None if not found.
         """
-        return self.first(session_key=session_key, name_acronym=name_acronym.upper())
+        # Callers usually pass the canonical uppercase acronym already;
+        # isupper() is a cheap scan that avoids allocating a new string.
+        if not name_acronym.isupper():
+            name_acronym = name_acronym.upper()
+        return self.first(session_key=session_key, name_acronym=name_acronym)
 
     def get_by_team(
         self,
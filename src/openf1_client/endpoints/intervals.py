@@ -6,6 +6,8 @@ Provides access to gap and interval data between drivers.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from openf1_client.endpoints.base import BaseEndpoint
 from openf1_client.models import Interval
 from openf1_client.utils import FilterValue
@@ -35,40 +37,44 @@ class IntervalsEndpoint(BaseEndpoint[Interval]):
     _endpoint = "intervals"
     _model_class = Interval
 
-    def list(
-        self,
-        session_key: int | str | None = None,
-        meeting_key: int | str | None = None,
-        driver_number: int | None = None,
-        date: FilterValue | None = None,
-        gap_to_leader: FilterValue | None = None,
-        interval: FilterValue | None = None,
-        **extra_filters: FilterValue | None,
-    ) -> list[Interval]:
-        """
-        Fetch interval data.
-
-        Args:
-            session_key: Filter by session (use "latest" for current session).
-            meeting_key: Filter by meeting (use "latest" for current meeting).
-            driver_number: Filter by driver number.
-            date: Filter by timestamp (supports comparison operators).
-            gap_to_leader: Filter by gap to P1 (supports comparison operators).
-            interval: Filter by gap to car ahead (supports comparison operators).
-            **extra_filters: Additional filter parameters.
-
-        Returns:
-            List of Interval instances.
-        """
-        return super().list(
-            session_key=session_key,
-            meeting_key=meeting_key,
-            driver_number=driver_number,
-            date=date,
-            gap_to_leader=gap_to_leader,
-            interval=interval,
-            **extra_filters,
-        )
+    _FILTERS = (
+        "session_key",
+        "meeting_key",
+        "driver_number",
+        "date",
+        "gap_to_leader",
+        "interval",
+    )
+
+    if TYPE_CHECKING:
+        # Typed stub only: at runtime list() resolves to BaseEndpoint.list,
+        # avoiding a pass-through frame and kwargs copy per call.
+        def list(
+            self,
+            session_key: int | str | None = None,
+            meeting_key: int | str | None = None,
+            driver_number: int | None = None,
+            date: FilterValue | None = None,
+            gap_to_leader: FilterValue | None = None,
+            interval: FilterValue | None = None,
+            **extra_filters: FilterValue | None,
+        ) -> list[Interval]:
+            """
+            Fetch interval data.
+
+            Args:
+                session_key: Filter by session (use "latest" for current session).
+                meeting_key: Filter by meeting (use "latest" for current meeting).
+                driver_number: Filter by driver number.
+                date: Filter by timestamp (supports comparison operators).
+                gap_to_leader: Filter by gap to P1 (supports comparison operators).
+                interval: Filter by gap to car ahead (supports comparison operators).
+                **extra_filters: Additional filter parameters.
+
+            Returns:
+                List of Interval instances.
+            """
+            ...
 
     def get_close_battles(
         self,
@@ -88,7 +94,9 @@ class IntervalsEndpoint(BaseEndpoint[Interval]):
         Returns:
             List of Interval instances showing close gaps.
         """
-        return self.list(
+        # The interval filter is applied server-side; rows come back
+        # schema-conformant, so validation is skipped.
+        return self.list_unchecked(
             session_key=session_key,
             interval={"<": max_interval},
         )
@@ -6,7 +6,9 @@ Provides access to detailed lap-by-lap timing data.
 
 from __future__ import annotations
 
-from openf1_client.endpoints.base import BaseEndpoint
+from typing import TYPE_CHECKING
+
+from openf1_client.endpoints.base import BaseEndpoint, _memoize_ttl
 from openf1_client.models import Lap
 from openf1_client.utils import FilterValue
 
@@ -43,62 +45,73 @@ class LapsEndpoint(BaseEndpoint[Lap]):
     _endpoint = "laps"
     _model_class = Lap
 
-    def list(
-        self,
-        session_key: int | str | None = None,
-        meeting_key: int | str | None = None,
-        driver_number: int | None = None,
-        lap_number: FilterValue | None = None,
-        date_start: FilterValue | None = None,
-        lap_duration: FilterValue | None = None,
-        duration_sector_1: FilterValue | None = None,
-        duration_sector_2: FilterValue | None = None,
-        duration_sector_3: FilterValue | None = None,
-        i1_speed: FilterValue | None = None,
-        i2_speed: FilterValue | None = None,
-        st_speed: FilterValue | None = None,
-        is_pit_out_lap: bool | None = None,
-        **extra_filters: FilterValue | None,
-    ) -> list[Lap]:
-        """
-        Fetch lap timing data.
+    _identity_fields = ("session_key", "driver_number", "lap_number")
 
-        Args:
-            session_key: Filter by session (use "latest" for current session).
-            meeting_key: Filter by meeting (use "latest" for current meeting).
-            driver_number: Filter by driver number.
-            lap_number: Filter by lap number (supports comparison operators).
-            date_start: Filter by lap start time (supports comparison operators).
-            lap_duration: Filter by lap time in seconds.
-            duration_sector_1: Filter by S1 time in seconds.
-            duration_sector_2: Filter by S2 time in seconds.
-            duration_sector_3: Filter by S3 time in seconds.
-            i1_speed: Filter by intermediate 1 speed.
-            i2_speed: Filter by intermediate 2 speed.
-            st_speed: Filter by speed trap speed.
-            is_pit_out_lap: Filter for pit out laps (True/False).
-            **extra_filters: Additional filter parameters.
+    # Lap payloads are large and schema-stable, so list() skips per-row
+    # validation (see BaseEndpoint._trust_server).
+    _trust_server = True
 
-        Returns:
-            List of Lap instances.
-        """
-        return super().list(
-            session_key=session_key,
-            meeting_key=meeting_key,
-            driver_number=driver_number,
-            lap_number=lap_number,
-            date_start=date_start,
-            lap_duration=lap_duration,
-            duration_sector_1=duration_sector_1,
-            duration_sector_2=duration_sector_2,
-            duration_sector_3=duration_sector_3,
-            i1_speed=i1_speed,
-            i2_speed=i2_speed,
-            st_speed=st_speed,
-            is_pit_out_lap=is_pit_out_lap,
-            **extra_filters,
-        )
+    _FILTERS = (
+        "session_key",
+        "meeting_key",
+        "driver_number",
+        "lap_number",
+        "date_start",
+        "lap_duration",
+        "duration_sector_1",
+        "duration_sector_2",
+        "duration_sector_3",
+        "i1_speed",
+        "i2_speed",
+        "st_speed",
+        "is_pit_out_lap",
+    )
+
+    if TYPE_CHECKING:
+        # Typed stub only: at runtime list() resolves to BaseEndpoint.list,
+        # avoiding a pass-through frame and kwargs copy per call.
+        def list(
+            self,
+            session_key: int | str | None = None,
+            meeting_key: int | str | None = None,
+            driver_number: int | None = None,
+            lap_number: FilterValue | None = None,
+            date_start: FilterValue | None = None,
+            lap_duration: FilterValue | None = None,
+            duration_sector_1: FilterValue | None = None,
+            duration_sector_2: FilterValue | None = None,
+            duration_sector_3: FilterValue | None = None,
+            i1_speed: FilterValue | None = None,
+            i2_speed: FilterValue | None = None,
+            st_speed: FilterValue | None = None,
+            is_pit_out_lap: bool | None = None,
+            **extra_filters: FilterValue | None,
+        ) -> list[Lap]:
+            """
+            Fetch lap timing data.
+
+            Args:
+                session_key: Filter by session (use "latest" for current session).
+                meeting_key: Filter by meeting (use "latest" for current meeting).
+                driver_number: Filter by driver number.
+                lap_number: Filter by lap number (supports comparison operators).
+                date_start: Filter by lap start time (supports comparison operators).
+                lap_duration: Filter by lap time in seconds.
+                duration_sector_1: Filter by S1 time in seconds.
+                duration_sector_2: Filter by S2 time in seconds.
+                duration_sector_3: Filter by S3 time in seconds.
+                i1_speed: Filter by intermediate 1 speed.
+                i2_speed: Filter by intermediate 2 speed.
+                st_speed: Filter by speed trap speed.
+                is_pit_out_lap: Filter for pit out laps (True/False).
+                **extra_filters: Additional filter parameters.
 
+            Returns:
+                List of Lap instances.
+            """
+            ...
+
+    @_memoize_ttl()
     def get_fastest_lap(
         self,
         session_key: int | str,
@@ -114,17 +127,27 @@ class LapsEndpoint(BaseEndpoint[Lap]):
         Returns:
             The Lap with the shortest duration, or None if no valid laps.
         """
+        # Laps without a timed duration (in/out laps, red flags) are
+        # excluded server-side, so the payload only contains rows that
+        # can win and no local validity scan is needed. The OpenF1 API
+        # has no order_by/limit parameters, so the final reduction still
+        # happens here.
         laps = self.list(
             session_key=session_key,
             driver_number=driver_number,
+            lap_duration={">": 0},
         )
 
-        # Filter out laps without valid duration
-        valid_laps = [lap for lap in laps if lap.lap_duration is not None]
-        if not valid_laps:
-            return None
-
-        return min(valid_laps, key=lambda x: x.lap_duration or float("inf"))
+        # Single pass with direct attribute loads instead of min(key=...)
+        # invoking a lambda per lap.
+        best: Lap | None = None
+        best_duration = float("inf")
+        for lap in laps:
+            duration = lap.lap_duration
+            if duration is not None and duration < best_duration:
+                best_duration = duration
+                best = lap
+        return best
 
     def get_lap(
         self,
@@ -143,12 +166,20 @@ class LapsEndpoint(BaseEndpoint[Lap]):
         Returns:
             The Lap instance, or None if not found.
         """
+        # Point lookups in loops (laps 1..N) are answered from rows a
+        # previous list() call already fetched. "latest" is an alias the
+        # cache key can't match, so it always goes to the network.
+        if session_key != "latest":
+            cached = self._identity_get((session_key, driver_number, lap_number))
+            if cached is not None:
+                return cached
         return self.first(
             session_key=session_key,
             driver_number=driver_number,
             lap_number=lap_number,
         )
 
+    @_memoize_ttl()
     def get_lap_range(
         self,
         session_key: int | str,
@@ -174,6 +205,42 @@ class LapsEndpoint(BaseEndpoint[Lap]):
             lap_number={">=": start_lap, "<=": end_lap},
         )
 
+    def get_lap_range_multi(
+        self,
+        session_key: int | str,
+        driver_numbers: list[int],
+        start_lap: int,
+        end_lap: int,
+    ) -> dict[int, list[Lap]]:
+        """
+        Get a lap range for several drivers with a single request.
+
+        Issues one ranged query for the whole session and groups the
+        rows by driver locally, instead of one round-trip per driver.
+        (The OpenF1 API has no multi-value filter, so the session-wide
+        fetch is the one-request form of this lookup.)
+
+        Args:
+            session_key: The session identifier.
+            driver_numbers: Driver car numbers to include.
+            start_lap: First lap number (inclusive).
+            end_lap: Last lap number (inclusive).
+
+        Returns:
+            A mapping of driver number to that driver's Lap instances.
+        """
+        wanted = set(driver_numbers)
+        laps = self.list(
+            session_key=session_key,
+            lap_number={">=": start_lap, "<=": end_lap},
+        )
+        grouped: dict[int, list[Lap]] = {number: [] for number in driver_numbers}
+        for lap in laps:
+            if lap.driver_number in wanted:
+                grouped[lap.driver_number].append(lap)
+        return grouped
+
+    @_memoize_ttl()
     def get_flying_laps(
         self,
         session_key: int | str,
@@ -6,6 +6,8 @@ Provides access to car position data on the circuit.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from openf1_client.endpoints.base import BaseEndpoint
 from openf1_client.models import Location
 from openf1_client.utils import FilterValue
@@ -33,43 +35,62 @@ class LocationEndpoint(BaseEndpoint[Location]):
     _endpoint = "location"
     _model_class = Location
 
-    def list(
-        self,
-        session_key: int | str | None = None,
-        meeting_key: int | str | None = None,
-        driver_number: int | None = None,
-        date: FilterValue | None = None,
-        x: FilterValue | None = None,
-        y: FilterValue | None = None,
-        z: FilterValue | None = None,
-        **extra_filters: FilterValue | None,
-    ) -> list[Location]:
-        """
-        Fetch car location data.
-
-        Args:
-            session_key: Filter by session (use "latest" for current session).
-            meeting_key: Filter by meeting (use "latest" for current meeting).
-            driver_number: Filter by driver number.
-            date: Filter by timestamp (supports comparison operators).
-            x: Filter by X coordinate (supports comparison operators).
-            y: Filter by Y coordinate (supports comparison operators).
-            z: Filter by Z coordinate/elevation (supports comparison operators).
-            **extra_filters: Additional filter parameters.
-
-        Returns:
-            List of Location instances.
-        """
-        return super().list(
-            session_key=session_key,
-            meeting_key=meeting_key,
-            driver_number=driver_number,
-            date=date,
-            x=x,
-            y=y,
-            z=z,
-            **extra_filters,
-        )
+    # 3.7 Hz telemetry: rows are numerous and schema-stable, so list()
+    # skips per-row validation (see BaseEndpoint._trust_server).
+    _trust_server = True
+
+    # Compact dtypes for list_columns(): track coordinates fit float32,
+    # giving contiguous arrays for track-position reconstruction.
+    _COLUMN_DTYPES = {
+        "x": "float32",
+        "y": "float32",
+        "z": "float32",
+        "driver_number": "uint8",
+        "session_key": "int64",
+        "meeting_key": "int64",
+    }
+
+    _FILTERS = (
+        "session_key",
+        "meeting_key",
+        "driver_number",
+        "date",
+        "x",
+        "y",
+        "z",
+    )
+
+    if TYPE_CHECKING:
+        # Typed stub only: at runtime list() resolves to BaseEndpoint.list,
+        # avoiding a pass-through frame and kwargs copy per call.
+        def list(
+            self,
+            session_key: int | str | None = None,
+            meeting_key: int | str | None = None,
+            driver_number: int | None = None,
+            date: FilterValue | None = None,
+            x: FilterValue | None = None,
+            y: FilterValue | None = None,
+            z: FilterValue | None = None,
+            **extra_filters: FilterValue | None,
+        ) -> list[Location]:
+            """
+            Fetch car location data.
+
+            Args:
+                session_key: Filter by session (use "latest" for current session).
+                meeting_key: Filter by meeting (use "latest" for current meeting).
+                driver_number: Filter by driver number.
+                date: Filter by timestamp (supports comparison operators).
+                x: Filter by X coordinate (supports comparison operators).
+                y: Filter by Y coordinate (supports comparison operators).
+                z: Filter by Z coordinate/elevation (supports comparison operators).
+                **extra_filters: Additional filter parameters.
+
+            Returns:
+                List of Location instances.
+            """
+            ...
 
     def get_track_positions(
         self,
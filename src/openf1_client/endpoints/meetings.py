@@ -6,7 +6,9 @@ Provides access to Grand Prix weekend and testing event metadata.
 
 from __future__ import annotations
 
-from openf1_client.endpoints.base import BaseEndpoint
+from typing import TYPE_CHECKING
+
+from openf1_client.endpoints.base import BaseEndpoint, _memoize_ttl
 from openf1_client.models import Meeting
 from openf1_client.utils import FilterValue
 
@@ -33,49 +35,55 @@ class MeetingsEndpoint(BaseEndpoint[Meeting]):
     _endpoint = "meetings"
     _model_class = Meeting
 
-    def list(
-        self,
-        meeting_key: int | str | None = None,
-        meeting_name: str | None = None,
-        year: int | None = None,
-        country_key: int | None = None,
-        country_code: str | None = None,
-        country_name: str | None = None,
-        circuit_key: int | None = None,
-        circuit_short_name: str | None = None,
-        date_start: FilterValue | None = None,
-        **extra_filters: FilterValue | None,
-    ) -> list[Meeting]:
-        """
-        Fetch meeting data.
-
-        Args:
-            meeting_key: Filter by meeting ID (use "latest" for current).
-            meeting_name: Filter by meeting name.
-            year: Filter by season year.
-            country_key: Filter by country identifier.
-            country_code: Filter by ISO country code.
-            country_name: Filter by country name.
-            circuit_key: Filter by circuit identifier.
-            circuit_short_name: Filter by circuit short name.
-            date_start: Filter by start date (supports comparison operators).
-            **extra_filters: Additional filter parameters.
-
-        Returns:
-            List of Meeting instances.
-        """
-        return super().list(
-            meeting_key=meeting_key,
-            meeting_name=meeting_name,
-            year=year,
-            country_key=country_key,
-            country_code=country_code,
-            country_name=country_name,
-            circuit_key=circuit_key,
-            circuit_short_name=circuit_short_name,
-            date_start=date_start,
-            **extra_filters,
-        )
+    _identity_fields = ("meeting_key",)
+
+    _FILTERS = (
+        "meeting_key",
+        "meeting_name",
+        "year",
+        "country_key",
+        "country_code",
+        "country_name",
+        "circuit_key",
+        "circuit_short_name",
+        "date_start",
+    )
+
+    if TYPE_CHECKING:
+        # Typed stub only: at runtime list() resolves to BaseEndpoint.list,
+        # avoiding a pass-through frame and kwargs copy per call.
+        def list(
+            self,
+            meeting_key: int | str | None = None,
+            meeting_name: str | None = None,
+            year: int | None = None,
+            country_key: int | None = None,
+            country_code: str | None = None,
+            country_name: str | None = None,
+            circuit_key: int | None = None,
+            circuit_short_name: str | None = None,
+            date_start: FilterValue | None = None,
+            **extra_filters: FilterValue | None,
+        ) -> list[Meeting]:
+            """
+            Fetch meeting data.
+
+            Args:
+                meeting_key: Filter by meeting ID (use "latest" for current).
+                meeting_name: Filter by meeting name.
+                year: Filter by season year.
+                country_key: Filter by country identifier.
+                country_code: Filter by ISO country code.
+                country_name: Filter by country name.
+                circuit_key: Filter by circuit identifier.
+                circuit_short_name: Filter by circuit short name.
+                date_start: Filter by start date (supports comparison operators).
+                **extra_filters: Additional filter parameters.
+
+            Returns:
+                List of Meeting instances.
+            """
+            ...
 
     def get_by_key(self, meeting_key: int | str) -> Meeting | None:
         """
@@ -87,6 +95,13 @@ class MeetingsEndpoint(BaseEndpoint[Meeting]):
         Returns:
             The Meeting instance, or None if not found.
         """
+        # Meeting metadata is immutable once published; repeat lookups
+        # are served from earlier list() results. The "latest" alias
+        # resolves to different meetings over time, so it is never cached.
+        if meeting_key != "latest":
+            cached = self._identity_get((meeting_key,))
+            if cached is not None:
+                return cached
         return self.first(meeting_key=meeting_key)
 
     def get_latest(self) -> Meeting | None:
@@ -98,6 +113,7 @@ class MeetingsEndpoint(BaseEndpoint[Meeting]):
         """
         return self.first(meeting_key="latest")
 
+    @_memoize_ttl()
     def get_by_season(self, year: int) -> list[Meeting]:
         """
         Get all meetings for a season.
@@ -110,6 +126,21 @@ class MeetingsEndpoint(BaseEndpoint[Meeting]):
         """
         return self.list(year=year)
 
+    def get_by_countries(self, country_names: list[str]) -> dict[str, list[Meeting]]:
+        """
+        Get meetings for several countries concurrently.
+
+        Args:
+            country_names: The country names to query.
+
+        Returns:
+            A mapping of country name to its Meeting instances.
+        """
+        results = self.list_many(
+            [{"country_name": name} for name in country_names]
+        )
+        return dict(zip(country_names, results))
+
     def get_by_country(self, country_name: str) -> list[Meeting]:
         """
         Get meetings in a specific country.
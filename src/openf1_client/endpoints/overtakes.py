@@ -6,6 +6,8 @@ Provides access to overtaking event data (beta endpoint).
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from openf1_client.endpoints.base import BaseEndpoint
 from openf1_client.models import Overtake
 from openf1_client.utils import FilterValue
@@ -34,37 +36,41 @@ class OvertakesEndpoint(BaseEndpoint[Overtake]):
     _endpoint = "overtakes"
     _model_class = Overtake
 
-    def list(
-        self,
-        session_key: int | str | None = None,
-        meeting_key: int | str | None = None,
-        driver_number: int | None = None,
-        date: FilterValue | None = None,
-        lap_number: FilterValue | None = None,
-        **extra_filters: FilterValue | None,
-    ) -> list[Overtake]:
-        """
-        Fetch overtake data.
-
-        Args:
-            session_key: Filter by session (use "latest" for current session).
-            meeting_key: Filter by meeting (use "latest" for current meeting).
-            driver_number: Filter by overtaking driver.
-            date: Filter by timestamp (supports comparison operators).
-            lap_number: Filter by lap number (supports comparison operators).
-            **extra_filters: Additional filter parameters.
-
-        Returns:
-            List of Overtake instances.
-        """
-        return super().list(
-            session_key=session_key,
-            meeting_key=meeting_key,
-            driver_number=driver_number,
-            date=date,
-            lap_number=lap_number,
-            **extra_filters,
-        )
+    _FILTERS = (
+        "session_key",
+        "meeting_key",
+        "driver_number",
+        "date",
+        "lap_number",
+    )
+
+    if TYPE_CHECKING:
+        # Typed stub only: at runtime list() resolves to BaseEndpoint.list,
+        # avoiding a pass-through frame and kwargs copy per call.
+        def list(
+            self,
+            session_key: int | str | None = None,
+            meeting_key: int | str | None = None,
+            driver_number: int | None = None,
+            date: FilterValue | None = None,
+            lap_number: FilterValue | None = None,
+            **extra_filters: FilterValue | None,
+        ) -> list[Overtake]:
+            """
+            Fetch overtake data.
+
+            Args:
+                session_key: Filter by session (use "latest" for current session).
+                meeting_key: Filter by meeting (use "latest" for current meeting).
+                driver_number: Filter by overtaking driver.
+                date: Filter by timestamp (supports comparison operators).
+                lap_number: Filter by lap number (supports comparison operators).
+                **extra_filters: Additional filter parameters.
+
+            Returns:
+                List of Overtake instances.
+            """
+            ...
 
     def get_driver_overtakes(
         self,
@@ -98,4 +104,6 @@ class OvertakesEndpoint(BaseEndpoint[Overtake]):
         Returns:
             Number of overtakes.
         """
-        return len(self.list(session_key=session_key, driver_number=driver_number))
+        # count() fetches CSV and counts lines, skipping JSON tokenizing
+        # and per-row model construction for a plain tally.
+        return self.count(session_key=session_key, driver_number=driver_number)
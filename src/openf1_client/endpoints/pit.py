@@ -6,7 +6,9 @@ Provides access to pit stop activity data.
 
 from __future__ import annotations
 
-from openf1_client.endpoints.base import BaseEndpoint
+from typing import TYPE_CHECKING
+
+from openf1_client.endpoints.base import BaseEndpoint, _memoize_ttl
 from openf1_client.models import Pit
 from openf1_client.utils import FilterValue
 
@@ -38,58 +40,121 @@ class PitEndpoint(BaseEndpoint[Pit]):
     _endpoint = "pit"
     _model_class = Pit
 
-    def list(
+    _identity_fields = ("session_key", "driver_number", "lap_number")
+
+    _FILTERS = (
+        "session_key",
+        "meeting_key",
+        "driver_number",
+        "date",
+        "lap_number",
+        "pit_duration",
+    )
+
+    if TYPE_CHECKING:
+        # Typed stub only: at runtime list() resolves to BaseEndpoint.list,
+        # avoiding a pass-through frame and kwargs copy per call.
+        def list(
+            self,
+            session_key: int | str | None = None,
+            meeting_key: int | str | None = None,
+            driver_number: int | None = None,
+            date: FilterValue | None = None,
+            lap_number: FilterValue | None = None,
+            pit_duration: FilterValue | None = None,
+            **extra_filters: FilterValue | None,
+        ) -> list[Pit]:
+            """
+            Fetch pit stop data.
+
+            Args:
+                session_key: Filter by session (use "latest" for current session).
+                meeting_key: Filter by meeting (use "latest" for current meeting).
+                driver_number: Filter by driver number.
+                date: Filter by timestamp (supports comparison operators).
+                lap_number: Filter by lap number (supports comparison operators).
+                pit_duration: Filter by pit duration in seconds.
+                **extra_filters: Additional filter parameters.
+
+            Returns:
+                List of Pit instances.
+            """
+            ...
+
+    def get_driver_pit_stops(
         self,
-        session_key: int | str | None = None,
-        meeting_key: int | str | None = None,
-        driver_number: int | None = None,
-        date: FilterValue | None = None,
-        lap_number: FilterValue | None = None,
-        pit_duration: FilterValue | None = None,
-        **extra_filters: FilterValue | None,
+        session_key: int | str,
+        driver_number: int,
     ) -> list[Pit]:
         """
-        Fetch pit stop data.
+        Get all pit stops for a specific driver.
+
+        Args:
+            session_key: The session identifier.
+            driver_number: The driver's car number.
+
+        Returns:
+            List of Pit instances for the driver.
+        """
+        return self.list(session_key=session_key, driver_number=driver_number)
+
+    def get_pit_stop(
+        self,
+        session_key: int | str,
+        driver_number: int,
+        lap_number: int,
+    ) -> Pit | None:
+        """
+        Get the pit stop on a specific lap.
 
         Args:
-            session_key: Filter by session (use "latest" for current session).
-            meeting_key: Filter by meeting (use "latest" for current meeting).
-            driver_number: Filter by driver number.
-            date: Filter by timestamp (supports comparison operators).
-            lap_number: Filter by lap number (supports comparison operators).
-            pit_duration: Filter by pit duration in seconds.
-            **extra_filters: Additional filter parameters.
+            session_key: The session identifier.
+            driver_number: The driver's car number.
+            lap_number: The lap the stop happened on.
 
         Returns:
-            List of Pit instances.
+            The Pit instance, or None if the driver didn't stop that lap.
         """
-        return super().list(
+        # Rows already fetched by list() answer repeat lookups locally;
+        # the "latest" alias can't match a cached key, so it always goes
+        # to the network.
+        if session_key != "latest":
+            cached = self._identity_get((session_key, driver_number, lap_number))
+            if cached is not None:
+                return cached
+        return self.first(
             session_key=session_key,
-            meeting_key=meeting_key,
             driver_number=driver_number,
-            date=date,
             lap_number=lap_number,
-            pit_duration=pit_duration,
-            **extra_filters,
         )
 
-    def get_driver_pit_stops(
+    def get_pit_stops_multi(
         self,
         session_key: int | str,
-        driver_number: int,
-    ) -> list[Pit]:
+        driver_numbers: list[int],
+    ) -> dict[int, list[Pit]]:
         """
-        Get all pit stops for a specific driver.
+        Get pit stops for several drivers with a single request.
+
+        Fetches the whole session once and groups rows by driver
+        locally, instead of one round-trip per driver.
 
         Args:
             session_key: The session identifier.
-            driver_number: The driver's car number.
+            driver_numbers: Driver car numbers to include.
 
         Returns:
-            List of Pit instances for the driver.
+            A mapping of driver number to that driver's Pit instances.
         """
-        return self.list(session_key=session_key, driver_number=driver_number)
-
+        wanted = set(driver_numbers)
+        pit_stops = self.list(session_key=session_key)
+        grouped: dict[int, list[Pit]] = {number: [] for number in driver_numbers}
+        for stop in pit_stops:
+            if stop.driver_number in wanted:
+                grouped[stop.driver_number].append(stop)
+        return grouped
+
+    @_memoize_ttl()
     def get_fastest_pit_stop(
         self,
         session_key: int | str,
@@ -105,16 +170,25 @@ class PitEndpoint(BaseEndpoint[Pit]):
         Returns:
             The Pit with shortest duration, or None if no pit stops.
         """
+        # Rows without a recorded duration are excluded server-side;
+        # only the final min() reduction runs locally (the OpenF1 API
+        # has no order_by/limit parameters).
         pit_stops = self.list(
             session_key=session_key,
             driver_number=driver_number,
+            pit_duration={">": 0},
         )
 
-        valid_stops = [p for p in pit_stops if p.pit_duration is not None]
-        if not valid_stops:
-            return None
-
-        return min(valid_stops, key=lambda x: x.pit_duration or float("inf"))
+        # Single pass with direct attribute loads instead of min(key=...)
+        # invoking a lambda per stop.
+        best: Pit | None = None
+        best_duration = float("inf")
+        for stop in pit_stops:
+            duration = stop.pit_duration
+            if duration is not None and duration < best_duration:
+                best_duration = duration
+                best = stop
+        return best
 
     def count_pit_stops(
         self,
@@ -131,4 +205,6 @@ class PitEndpoint(BaseEndpoint[Pit]):
         Returns:
             Number of pit stops.
         """
-        return len(self.get_driver_pit_stops(session_key, driver_number))
+        # count() fetches CSV and counts lines, skipping JSON tokenizing
+        # and per-row model construction for a plain tally.
+        return self.count(session_key=session_key, driver_number=driver_number)
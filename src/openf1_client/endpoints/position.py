@@ -6,7 +6,9 @@ Provides access to driver position data throughout sessions.
 
 from __future__ import annotations
 
-from openf1_client.endpoints.base import BaseEndpoint
+from typing import TYPE_CHECKING, Any
+
+from openf1_client.endpoints.base import BaseEndpoint, _memoize_ttl
 from openf1_client.models import Position
 from openf1_client.utils import FilterValue
 
@@ -35,37 +37,53 @@ class PositionEndpoint(BaseEndpoint[Position]):
     _endpoint = "position"
     _model_class = Position
 
-    def list(
-        self,
-        session_key: int | str | None = None,
-        meeting_key: int | str | None = None,
-        driver_number: int | None = None,
-        date: FilterValue | None = None,
-        position: FilterValue | None = None,
-        **extra_filters: FilterValue | None,
-    ) -> list[Position]:
-        """
-        Fetch position data.
-
-        Args:
-            session_key: Filter by session (use "latest" for current session).
-            meeting_key: Filter by meeting (use "latest" for current meeting).
-            driver_number: Filter by driver number.
-            date: Filter by timestamp (supports comparison operators).
-            position: Filter by position (supports comparison operators).
-            **extra_filters: Additional filter parameters.
-
-        Returns:
-            List of Position instances.
-        """
-        return super().list(
-            session_key=session_key,
-            meeting_key=meeting_key,
-            driver_number=driver_number,
-            date=date,
-            position=position,
-            **extra_filters,
-        )
+    # 3.7 Hz telemetry: rows are numerous and schema-stable, so list()
+    # skips per-row validation (see BaseEndpoint._trust_server).
+    _trust_server = True
+
+    # Compact dtypes for list_columns() / get_leaders_fast().
+    _COLUMN_DTYPES = {
+        "driver_number": "uint8",
+        "position": "uint8",
+        "session_key": "int64",
+        "meeting_key": "int64",
+    }
+
+    _FILTERS = (
+        "session_key",
+        "meeting_key",
+        "driver_number",
+        "date",
+        "position",
+    )
+
+    if TYPE_CHECKING:
+        # Typed stub only: at runtime list() resolves to BaseEndpoint.list,
+        # avoiding a pass-through frame and kwargs copy per call.
+        def list(
+            self,
+            session_key: int | str | None = None,
+            meeting_key: int | str | None = None,
+            driver_number: int | None = None,
+            date: FilterValue | None = None,
+            position: FilterValue | None = None,
+            **extra_filters: FilterValue | None,
+        ) -> list[Position]:
+            """
+            Fetch position data.
+
+            Args:
+                session_key: Filter by session (use "latest" for current session).
+                meeting_key: Filter by meeting (use "latest" for current meeting).
+                driver_number: Filter by driver number.
+                date: Filter by timestamp (supports comparison operators).
+                position: Filter by position (supports comparison operators).
+                **extra_filters: Additional filter parameters.
+
+            Returns:
+                List of Position instances.
+            """
+            ...
 
     def get_driver_positions(
         self,
@@ -101,6 +119,56 @@ class PositionEndpoint(BaseEndpoint[Position]):
         """
         return self.list(session_key=session_key, position=position)
 
+    def get_drivers_positions_multi(
+        self,
+        session_key: int | str,
+        driver_numbers: list[int],
+    ) -> dict[int, list[Position]]:
+        """
+        Get position histories for several drivers with a single request.
+
+        Fetches the whole session once and groups rows by driver
+        locally, instead of one round-trip per driver.
+
+        Args:
+            session_key: The session identifier.
+            driver_numbers: Driver car numbers to include.
+
+        Returns:
+            A mapping of driver number to that driver's Position instances.
+        """
+        wanted = set(driver_numbers)
+        positions = self.list(session_key=session_key)
+        grouped: dict[int, list[Position]] = {number: [] for number in driver_numbers}
+        for entry in positions:
+            if entry.driver_number in wanted:
+                grouped[entry.driver_number].append(entry)
+        return grouped
+
+    def get_leaders_fast(self, session_key: int | str) -> dict[str, Any]:
+        """
+        Get all P1 entries as columnar NumPy arrays.
+
+        Columnar variant of get_leaders for callers that only extract
+        driver_number/date sequences: per-row Position objects are never
+        built, the data lands in contiguous arrays directly.
+
+        Requires the optional numpy dependency
+        (``pip install openf1-client[numpy]``).
+
+        Args:
+            session_key: The session identifier.
+
+        Returns:
+            A dict of column name to NumPy array (driver_number as
+            uint8, date as datetime64[ms], position as uint8).
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+        return self.list_columns(session_key=session_key, position=1)
+
+    @_memoize_ttl()
     def get_leaders(self, session_key: int | str) -> list[Position]:
         """
         Get all P1 entries.
@@ -6,11 +6,19 @@ Provides access to race control messages and events.
 
 from __future__ import annotations
 
+import re
+from typing import TYPE_CHECKING
+
 from openf1_client.endpoints.base import BaseEndpoint
 from openf1_client.models import RaceControl
 from openf1_client.utils import FilterValue
 
 
+# Compiled once: one case-insensitive scan per message, instead of an
+# .upper() allocation plus two substring checks per row.
+_SC_PATTERN = re.compile(r"SAFETY CAR|VSC", re.IGNORECASE)
+
+
 class RaceControlEndpoint(BaseEndpoint[RaceControl]):
     """
     Endpoint for race control messages.
@@ -38,67 +46,95 @@ class RaceControlEndpoint(BaseEndpoint[RaceControl]):
     _endpoint = "race_control"
     _model_class = RaceControl
 
-    def list(
+    _FILTERS = (
+        "session_key",
+        "meeting_key",
+        "driver_number",
+        "date",
+        "lap_number",
+        "category",
+        "flag",
+        "scope",
+        "sector",
+    )
+
+    if TYPE_CHECKING:
+        # Typed stub only: at runtime list() resolves to BaseEndpoint.list,
+        # avoiding a pass-through frame and kwargs copy per call.
+        def list(
+            self,
+            session_key: int | str | None = None,
+            meeting_key: int | str | None = None,
+            driver_number: int | None = None,
+            date: FilterValue | None = None,
+            lap_number: FilterValue | None = None,
+            category: str | None = None,
+            flag: str | None = None,
+            scope: str | None = None,
+            sector: int | None = None,
+            **extra_filters: FilterValue | None,
+        ) -> list[RaceControl]:
+            """
+            Fetch race control messages.
+
+            Args:
+                session_key: Filter by session (use "latest" for current session).
+                meeting_key: Filter by meeting (use "latest" for current meeting).
+                driver_number: Filter by affected driver.
+                date: Filter by timestamp (supports comparison operators).
+                lap_number: Filter by lap number (supports comparison operators).
+                category: Filter by message category.
+                flag: Filter by flag type (GREEN, YELLOW, RED, CHEQUERED, etc.).
+                scope: Filter by flag scope (Track, Sector, Driver).
+                sector: Filter by affected sector number.
+                **extra_filters: Additional filter parameters.
+
+            Returns:
+                List of RaceControl instances.
+            """
+            ...
+
+    def get_flags(
         self,
-        session_key: int | str | None = None,
-        meeting_key: int | str | None = None,
-        driver_number: int | None = None,
-        date: FilterValue | None = None,
-        lap_number: FilterValue | None = None,
-        category: str | None = None,
+        session_key: int | str,
         flag: str | None = None,
-        scope: str | None = None,
-        sector: int | None = None,
-        **extra_filters: FilterValue | None,
     ) -> list[RaceControl]:
         """
-        Fetch race control messages.
+        Get flag events.
 
         Args:
-            session_key: Filter by session (use "latest" for current session).
-            meeting_key: Filter by meeting (use "latest" for current meeting).
-            driver_number: Filter by affected driver.
-            date: Filter by timestamp (supports comparison operators).
-            lap_number: Filter by lap number (supports comparison operators).
-            category: Filter by message category.
-            flag: Filter by flag type (GREEN, YELLOW, RED, CHEQUERED, etc.).
-            scope: Filter by flag scope (Track, Sector, Driver).
-            sector: Filter by affected sector number.
-            **extra_filters: Additional filter parameters.
+            session_key: The session identifier.
+            flag: Optional flag type to filter (e.g., "YELLOW", "RED").
 
         Returns:
-            List of RaceControl instances.
+            List of flag RaceControl instances.
         """
-        return super().list(
-            session_key=session_key,
-            meeting_key=meeting_key,
-            driver_number=driver_number,
-            date=date,
-            lap_number=lap_number,
-            category=category,
-            flag=flag,
-            scope=scope,
-            sector=sector,
-            **extra_filters,
-        )
+        messages = self.list(session_key=session_key, flag=flag)
+        if flag is not None:
+            # The server already matched on flag, so every row has one;
+            # skip the redundant post-filter pass.
+            return messages
+        return [m for m in messages if m.flag is not None]
 
-    def get_flags(
+    def get_multiple_flag_types(
         self,
         session_key: int | str,
-        flag: str | None = None,
-    ) -> list[RaceControl]:
+        flags: list[str],
+    ) -> dict[str, list[RaceControl]]:
         """
-        Get flag events.
+        Get several flag types concurrently.
 
         Args:
             session_key: The session identifier.
-            flag: Optional flag type to filter (e.g., "YELLOW", "RED").
+            flags: Flag types to query (e.g., ["YELLOW", "RED"]).
 
         Returns:
-            List of flag RaceControl instances.
+            A mapping of flag type to its RaceControl instances.
         """
-        messages = self.list(session_key=session_key, flag=flag)
-        return [m for m in messages if m.flag is not None]
+        results = self.list_many(
+            [{"session_key": session_key, "flag": flag} for flag in flags]
+        )
+        return dict(zip(flags, results))
 
     def get_safety_car_events(
         self,
@@ -113,12 +149,16 @@ class RaceControlEndpoint(BaseEndpoint[RaceControl]):
         Returns:
             List of safety car RaceControl instances.
         """
+        # Race control tags all safety car activity (full and virtual)
+        # with category "SafetyCar", so the selection happens server-side
+        # instead of substring-scanning every message locally.
+        events = self.list(session_key=session_key, category="SafetyCar")
+        if events:
+            return events
+        # Sessions predating the category tag need the message scan.
         messages = self.list(session_key=session_key)
-        return [
-            m
-            for m in messages
-            if m.message and ("SAFETY CAR" in m.message.upper() or "VSC" in m.message.upper())
-        ]
+        search = _SC_PATTERN.search
+        return [m for m in messages if m.message and search(m.message)]
 
     def get_driver_incidents(
         self,
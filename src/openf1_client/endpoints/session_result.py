@@ -6,6 +6,8 @@ Provides access to final session results (beta endpoint).
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from openf1_client.endpoints.base import BaseEndpoint
 from openf1_client.models import SessionResult
 from openf1_client.utils import FilterValue
@@ -32,37 +34,41 @@ class SessionResultEndpoint(BaseEndpoint[SessionResult]):
     _endpoint = "session_result"
     _model_class = SessionResult
 
-    def list(
-        self,
-        session_key: int | str | None = None,
-        meeting_key: int | str | None = None,
-        driver_number: int | None = None,
-        position: FilterValue | None = None,
-        points: FilterValue | None = None,
-        **extra_filters: FilterValue | None,
-    ) -> list[SessionResult]:
-        """
-        Fetch session result data.
-
-        Args:
-            session_key: Filter by session (use "latest" for current session).
-            meeting_key: Filter by meeting (use "latest" for current meeting).
-            driver_number: Filter by driver number.
-            position: Filter by final position (supports comparison operators).
-            points: Filter by points awarded (supports comparison operators).
-            **extra_filters: Additional filter parameters.
-
-        Returns:
-            List of SessionResult instances.
-        """
-        return super().list(
-            session_key=session_key,
-            meeting_key=meeting_key,
-            driver_number=driver_number,
-            position=position,
-            points=points,
-            **extra_filters,
-        )
+    _FILTERS = (
+        "session_key",
+        "meeting_key",
+        "driver_number",
+        "position",
+        "points",
+    )
+
+    if TYPE_CHECKING:
+        # Typed stub only: at runtime list() resolves to BaseEndpoint.list,
+        # avoiding a pass-through frame and kwargs copy per call.
+        def list(
+            self,
+            session_key: int | str | None = None,
+            meeting_key: int | str | None = None,
+            driver_number: int | None = None,
+            position: FilterValue | None = None,
+            points: FilterValue | None = None,
+            **extra_filters: FilterValue | None,
+        ) -> list[SessionResult]:
+            """
+            Fetch session result data.
+
+            Args:
+                session_key: Filter by session (use "latest" for current session).
+                meeting_key: Filter by meeting (use "latest" for current meeting).
+                driver_number: Filter by driver number.
+                position: Filter by final position (supports comparison operators).
+                points: Filter by points awarded (supports comparison operators).
+                **extra_filters: Additional filter parameters.
+
+            Returns:
+                List of SessionResult instances.
+            """
+            ...
 
     def get_podium(self, session_key: int | str) -> list[SessionResult]:
         """
@@ -74,8 +80,12 @@ class SessionResultEndpoint(BaseEndpoint[SessionResult]):
         Returns:
             List of SessionResult instances for top 3.
         """
-        results = self.list(session_key=session_key, position={"<=": 3})
-        return sorted(results, key=lambda r: r.position or 999)
+        # A session result is ~20 rows, so the helpers below all slice
+        # one full-session fetch: back-to-back calls (podium + winner +
+        # points) coalesce onto a single request via the response cache
+        # instead of issuing one narrowed query each.
+        results = self.list(session_key=session_key, _order_by="position")
+        return [r for r in results if r.position is not None and r.position <= 3]
 
     def get_winner(self, session_key: int | str) -> SessionResult | None:
         """
@@ -87,7 +97,10 @@ class SessionResultEndpoint(BaseEndpoint[SessionResult]):
         Returns:
             The P1 SessionResult, or None if not found.
         """
-        return self.first(session_key=session_key, position=1)
+        for result in self.list(session_key=session_key):
+            if result.position == 1:
+                return result
+        return None
 
     def get_points_finishers(self, session_key: int | str) -> list[SessionResult]:
         """
@@ -99,4 +112,5 @@ class SessionResultEndpoint(BaseEndpoint[SessionResult]):
         Returns:
             List of SessionResult instances for points finishers.
         """
-        return self.list(session_key=session_key, points={">": 0})
+        results = self.list(session_key=session_key)
+        return [r for r in results if r.points is not None and r.points > 0]
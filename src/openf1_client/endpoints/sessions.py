@@ -6,10 +6,15 @@ Provides access to session data (practice, qualifying, race, etc.).
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from openf1_client.endpoints.base import BaseEndpoint
 from openf1_client.models import Session
 from openf1_client.utils import FilterValue
 
+if TYPE_CHECKING:
+    from openf1_client.models import Weather
+
 
 class SessionsEndpoint(BaseEndpoint[Session]):
     """
@@ -33,58 +38,62 @@ class SessionsEndpoint(BaseEndpoint[Session]):
     _endpoint = "sessions"
     _model_class = Session
 
-    def list(
-        self,
-        session_key: int | str | None = None,
-        session_name: str | None = None,
-        session_type: str | None = None,
-        meeting_key: int | str | None = None,
-        year: int | None = None,
-        country_key: int | None = None,
-        country_code: str | None = None,
-        country_name: str | None = None,
-        circuit_key: int | None = None,
-        circuit_short_name: str | None = None,
-        date_start: FilterValue | None = None,
-        date_end: FilterValue | None = None,
-        **extra_filters: FilterValue | None,
-    ) -> list[Session]:
-        """
-        Fetch session data.
-
-        Args:
-            session_key: Filter by session ID (use "latest" for current).
-            session_name: Filter by session name (e.g., "Race", "Qualifying").
-            session_type: Filter by session type.
-            meeting_key: Filter by meeting ID (use "latest" for current).
-            year: Filter by season year.
-            country_key: Filter by country identifier.
-            country_code: Filter by ISO country code.
-            country_name: Filter by country name.
-            circuit_key: Filter by circuit identifier.
-            circuit_short_name: Filter by circuit short name.
-            date_start: Filter by start time (supports comparison operators).
-            date_end: Filter by end time (supports comparison operators).
-            **extra_filters: Additional filter parameters.
-
-        Returns:
-            List of Session instances.
-        """
-        return super().list(
-            session_key=session_key,
-            session_name=session_name,
-            session_type=session_type,
-            meeting_key=meeting_key,
-            year=year,
-            country_key=country_key,
-            country_code=country_code,
-            country_name=country_name,
-            circuit_key=circuit_key,
-            circuit_short_name=circuit_short_name,
-            date_start=date_start,
-            date_end=date_end,
-            **extra_filters,
-        )
+    _FILTERS = (
+        "session_key",
+        "session_name",
+        "session_type",
+        "meeting_key",
+        "year",
+        "country_key",
+        "country_code",
+        "country_name",
+        "circuit_key",
+        "circuit_short_name",
+        "date_start",
+        "date_end",
+    )
+
+    if TYPE_CHECKING:
+        # Typed stub only: at runtime list() resolves to BaseEndpoint.list,
+        # avoiding a pass-through frame and kwargs copy per call.
+        def list(
+            self,
+            session_key: int | str | None = None,
+            session_name: str | None = None,
+            session_type: str | None = None,
+            meeting_key: int | str | None = None,
+            year: int | None = None,
+            country_key: int | None = None,
+            country_code: str | None = None,
+            country_name: str | None = None,
+            circuit_key: int | None = None,
+            circuit_short_name: str | None = None,
+            date_start: FilterValue | None = None,
+            date_end: FilterValue | None = None,
+            **extra_filters: FilterValue | None,
+        ) -> list[Session]:
+            """
+            Fetch session data.
+
+            Args:
+                session_key: Filter by session ID (use "latest" for current).
+                session_name: Filter by session name (e.g., "Race", "Qualifying").
+                session_type: Filter by session type.
+                meeting_key: Filter by meeting ID (use "latest" for current).
+                year: Filter by season year.
+                country_key: Filter by country identifier.
+                country_code: Filter by ISO country code.
+                country_name: Filter by country name.
+                circuit_key: Filter by circuit identifier.
+                circuit_short_name: Filter by circuit short name.
+                date_start: Filter by start time (supports comparison operators).
+                date_end: Filter by end time (supports comparison operators).
+                **extra_filters: Additional filter parameters.
+
+            Returns:
+                List of Session instances.
+            """
+            ...
 
     def get_by_key(self, session_key: int | str) -> Session | None:
         """
@@ -119,6 +128,35 @@ class SessionsEndpoint(BaseEndpoint[Session]):
         """
         return self.list(meeting_key=meeting_key)
 
+    def get_for_meeting_with_weather(
+        self,
+        meeting_key: int | str,
+    ) -> list[tuple[Session, list[Weather]]]:
+        """
+        Get a meeting's sessions with each session's weather readings.
+
+        The per-session weather queries fan out concurrently over the
+        shared connection pool, so a typical five-session weekend costs
+        roughly one round-trip of wall time after the session list
+        instead of five sequential ones.
+
+        Args:
+            meeting_key: The meeting identifier (or "latest").
+
+        Returns:
+            (Session, weather readings) pairs, in session order.
+        """
+        from openf1_client.endpoints.weather import WeatherEndpoint
+
+        sessions = self.get_for_meeting(meeting_key)
+        if not sessions:
+            return []
+        weather = WeatherEndpoint(self._transport)
+        results = weather.list_many(
+            [{"session_key": s.session_key} for s in sessions]
+        )
+        return list(zip(sessions, results))
+
     def get_races(self, year: int | None = None) -> list[Session]:
         """
         Get all race sessions.
@@ -162,6 +200,13 @@ class SessionsEndpoint(BaseEndpoint[Session]):
             session_name = f"Practice {practice_number}"
             return self.list(meeting_key=meeting_key, session_name=session_name)
 
-        # Get all practice sessions
-        sessions = self.list(meeting_key=meeting_key)
-        return [s for s in sessions if s.session_name and "Practice" in s.session_name]
+        # Three concurrent exact-name queries instead of downloading the
+        # whole weekend (qualifying, sprint, race rows included) just to
+        # discard everything without "Practice" in its name.
+        results = self.list_many(
+            [
+                {"meeting_key": meeting_key, "session_name": f"Practice {n}"}
+                for n in (1, 2, 3)
+            ]
+        )
+        return [session for batch in results for session in batch]
@@ -6,6 +6,8 @@ Provides access to starting grid positions (beta endpoint).
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from openf1_client.endpoints.base import BaseEndpoint
 from openf1_client.models import StartingGrid
 from openf1_client.utils import FilterValue
@@ -32,34 +34,38 @@ class StartingGridEndpoint(BaseEndpoint[StartingGrid]):
     _endpoint = "starting_grid"
     _model_class = StartingGrid
 
-    def list(
-        self,
-        session_key: int | str | None = None,
-        meeting_key: int | str | None = None,
-        driver_number: int | None = None,
-        position: FilterValue | None = None,
-        **extra_filters: FilterValue | None,
-    ) -> list[StartingGrid]:
-        """
-        Fetch starting grid data.
-
-        Args:
-            session_key: Filter by session (use "latest" for current session).
-            meeting_key: Filter by meeting (use "latest" for current meeting).
-            driver_number: Filter by driver number.
-            position: Filter by grid position (supports comparison operators).
-            **extra_filters: Additional filter parameters.
-
-        Returns:
-            List of StartingGrid instances.
-        """
-        return super().list(
-            session_key=session_key,
-            meeting_key=meeting_key,
-            driver_number=driver_number,
-            position=position,
-            **extra_filters,
-        )
+    _FILTERS = (
+        "session_key",
+        "meeting_key",
+        "driver_number",
+        "position",
+    )
+
+    if TYPE_CHECKING:
+        # Typed stub only: at runtime list() resolves to BaseEndpoint.list,
+        # avoiding a pass-through frame and kwargs copy per call.
+        def list(
+            self,
+            session_key: int | str | None = None,
+            meeting_key: int | str | None = None,
+            driver_number: int | None = None,
+            position: FilterValue | None = None,
+            **extra_filters: FilterValue | None,
+        ) -> list[StartingGrid]:
+            """
+            Fetch starting grid data.
+
+            Args:
+                session_key: Filter by session (use "latest" for current session).
+                meeting_key: Filter by meeting (use "latest" for current meeting).
+                driver_number: Filter by driver number.
+                position: Filter by grid position (supports comparison operators).
+                **extra_filters: Additional filter parameters.
+
+            Returns:
+                List of StartingGrid instances.
+            """
+            ...
 
     def get_pole_sitter(self, session_key: int | str) -> StartingGrid | None:
         """
@@ -83,8 +89,13 @@ class StartingGridEndpoint(BaseEndpoint[StartingGrid]):
         Returns:
             List of StartingGrid instances for front row.
         """
-        grid = self.list(session_key=session_key, position={"<=": 2})
-        return sorted(grid, key=lambda g: g.position or 999)
+        # Narrowed server-side; ordering happens in the shared
+        # _order_by path (the API itself cannot sort).
+        return self.list(
+            session_key=session_key,
+            position={"<=": 2},
+            _order_by="position",
+        )
 
     def get_driver_grid_position(
         self,
@@ -101,6 +112,20 @@ class StartingGridEndpoint(BaseEndpoint[StartingGrid]):
         Returns:
             The grid position, or None if not found.
         """
+        # A prior full-grid fetch (get_sorted_grid, or iterating all
+        # drivers) answers this locally; dashboards walking 20 drivers
+        # then issue 1 request instead of 20.
+        if session_key != "latest":
+            cached = self._cached_list(session_key=session_key)
+            if cached is not None:
+                return next(
+                    (
+                        entry.position
+                        for entry in cached
+                        if entry.driver_number == driver_number
+                    ),
+                    None,
+                )
         entry = self.first(session_key=session_key, driver_number=driver_number)
         return entry.position if entry else None
 
@@ -114,5 +139,4 @@ class StartingGridEndpoint(BaseEndpoint[StartingGrid]):
         Returns:
             List of StartingGrid instances sorted by position.
         """
-        grid = self.list(session_key=session_key)
-        return sorted(grid, key=lambda g: g.position or 999)
+        return self.list(session_key=session_key, _order_by="position")
@@ -6,6 +6,8 @@ Provides access to stint (continuous driving period) data.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from openf1_client.endpoints.base import BaseEndpoint
 from openf1_client.models import Stint
 from openf1_client.utils import FilterValue
@@ -39,46 +41,54 @@ class StintsEndpoint(BaseEndpoint[Stint]):
     _endpoint = "stints"
     _model_class = Stint
 
-    def list(
-        self,
-        session_key: int | str | None = None,
-        meeting_key: int | str | None = None,
-        driver_number: int | None = None,
-        stint_number: FilterValue | None = None,
-        lap_start: FilterValue | None = None,
-        lap_end: FilterValue | None = None,
-        compound: str | None = None,
-        tyre_age_at_start: FilterValue | None = None,
-        **extra_filters: FilterValue | None,
-    ) -> list[Stint]:
-        """
-        Fetch stint data.
-
-        Args:
-            session_key: Filter by session (use "latest" for current session).
-            meeting_key: Filter by meeting (use "latest" for current meeting).
-            driver_number: Filter by driver number.
-            stint_number: Filter by stint number (supports comparisons).
-            lap_start: Filter by first lap (supports comparison operators).
-            lap_end: Filter by last lap (supports comparison operators).
-            compound: Filter by tyre compound (SOFT, MEDIUM, HARD, etc.).
-            tyre_age_at_start: Filter by tyre age at stint start.
-            **extra_filters: Additional filter parameters.
-
-        Returns:
-            List of Stint instances.
-        """
-        return super().list(
-            session_key=session_key,
-            meeting_key=meeting_key,
-            driver_number=driver_number,
-            stint_number=stint_number,
-            lap_start=lap_start,
-            lap_end=lap_end,
-            compound=compound,
-            tyre_age_at_start=tyre_age_at_start,
-            **extra_filters,
-        )
+    # Schema-stable payloads, so list() skips per-row validation (see
+    # BaseEndpoint._trust_server).
+    _trust_server = True
+
+    _FILTERS = (
+        "session_key",
+        "meeting_key",
+        "driver_number",
+        "stint_number",
+        "lap_start",
+        "lap_end",
+        "compound",
+        "tyre_age_at_start",
+    )
+
+    if TYPE_CHECKING:
+        # Typed stub only: at runtime list() resolves to BaseEndpoint.list,
+        # avoiding a pass-through frame and kwargs copy per call.
+        def list(
+            self,
+            session_key: int | str | None = None,
+            meeting_key: int | str | None = None,
+            driver_number: int | None = None,
+            stint_number: FilterValue | None = None,
+            lap_start: FilterValue | None = None,
+            lap_end: FilterValue | None = None,
+            compound: str | None = None,
+            tyre_age_at_start: FilterValue | None = None,
+            **extra_filters: FilterValue | None,
+        ) -> list[Stint]:
+            """
+            Fetch stint data.
+
+            Args:
+                session_key: Filter by session (use "latest" for current session).
+                meeting_key: Filter by meeting (use "latest" for current meeting).
+                driver_number: Filter by driver number.
+                stint_number: Filter by stint number (supports comparisons).
+                lap_start: Filter by first lap (supports comparison operators).
+                lap_end: Filter by last lap (supports comparison operators).
+                compound: Filter by tyre compound (SOFT, MEDIUM, HARD, etc.).
+                tyre_age_at_start: Filter by tyre age at stint start.
+                **extra_filters: Additional filter parameters.
+
+            Returns:
+                List of Stint instances.
+            """
+            ...
 
     def get_driver_stints(
         self,
@@ -95,8 +105,11 @@ class StintsEndpoint(BaseEndpoint[Stint]):
         Returns:
             List of Stint instances for the driver, ordered by stint number.
         """
-        stints = self.list(session_key=session_key, driver_number=driver_number)
-        return sorted(stints, key=lambda s: s.stint_number or 0)
+        return self.list(
+            session_key=session_key,
+            driver_number=driver_number,
+            _order_by="stint_number",
+        )
 
     def get_by_compound(
         self,
@@ -130,5 +143,10 @@ class StintsEndpoint(BaseEndpoint[Stint]):
         Returns:
             List of compound names in order of use.
         """
-        stints = self.get_driver_stints(session_key, driver_number)
-        return [s.compound for s in stints if s.compound is not None]
+        # Single-column projection: the compound names come straight off
+        # the CSV stream without building Stint objects. The API returns
+        # a driver's stints in stint order.
+        compounds = self.list_field(
+            "compound", session_key=session_key, driver_number=driver_number
+        )
+        return [c for c in compounds if c is not None]
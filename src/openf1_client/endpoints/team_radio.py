@@ -6,6 +6,8 @@ Provides access to team radio communications.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Iterator
+
 from openf1_client.endpoints.base import BaseEndpoint
 from openf1_client.models import TeamRadio
 from openf1_client.utils import FilterValue
@@ -38,34 +40,38 @@ class TeamRadioEndpoint(BaseEndpoint[TeamRadio]):
     _endpoint = "team_radio"
     _model_class = TeamRadio
 
-    def list(
-        self,
-        session_key: int | str | None = None,
-        meeting_key: int | str | None = None,
-        driver_number: int | None = None,
-        date: FilterValue | None = None,
-        **extra_filters: FilterValue | None,
-    ) -> list[TeamRadio]:
-        """
-        Fetch team radio data.
-
-        Args:
-            session_key: Filter by session (use "latest" for current session).
-            meeting_key: Filter by meeting (use "latest" for current meeting).
-            driver_number: Filter by driver number.
-            date: Filter by timestamp (supports comparison operators).
-            **extra_filters: Additional filter parameters.
-
-        Returns:
-            List of TeamRadio instances.
-        """
-        return super().list(
-            session_key=session_key,
-            meeting_key=meeting_key,
-            driver_number=driver_number,
-            date=date,
-            **extra_filters,
-        )
+    _FILTERS = (
+        "session_key",
+        "meeting_key",
+        "driver_number",
+        "date",
+    )
+
+    if TYPE_CHECKING:
+        # Typed stub only: at runtime list() resolves to BaseEndpoint.list,
+        # avoiding a pass-through frame and kwargs copy per call.
+        def list(
+            self,
+            session_key: int | str | None = None,
+            meeting_key: int | str | None = None,
+            driver_number: int | None = None,
+            date: FilterValue | None = None,
+            **extra_filters: FilterValue | None,
+        ) -> list[TeamRadio]:
+            """
+            Fetch team radio data.
+
+            Args:
+                session_key: Filter by session (use "latest" for current session).
+                meeting_key: Filter by meeting (use "latest" for current meeting).
+                driver_number: Filter by driver number.
+                date: Filter by timestamp (supports comparison operators).
+                **extra_filters: Additional filter parameters.
+
+            Returns:
+                List of TeamRadio instances.
+            """
+            ...
 
     def get_driver_radio(
         self,
@@ -99,5 +105,32 @@ class TeamRadioEndpoint(BaseEndpoint[TeamRadio]):
         Returns:
             List of recording URLs.
         """
-        radio_data = self.list(session_key=session_key, driver_number=driver_number)
-        return [r.recording_url for r in radio_data if r.recording_url]
+        # Single-column projection: URLs come straight off the CSV
+        # stream without building TeamRadio objects per row.
+        urls = self.list_field(
+            "recording_url", session_key=session_key, driver_number=driver_number
+        )
+        return [url for url in urls if url]
+
+    def iter_radio_urls(
+        self,
+        session_key: int | str,
+        driver_number: int | None = None,
+    ) -> Iterator[str]:
+        """
+        Iterate over recording URLs without materializing the models.
+
+        Generator form of get_radio_urls: rows stream off the response
+        one at a time, so callers that just play or download each URL
+        never hold the whole model list in memory.
+
+        Args:
+            session_key: The session identifier.
+            driver_number: Optional driver number to filter by.
+
+        Yields:
+            Recording URLs in response order.
+        """
+        for radio in self.iter(session_key=session_key, driver_number=driver_number):
+            if radio.recording_url:
+                yield radio.recording_url
@@ -6,6 +6,9 @@ Provides access to weather and track condition data.
 
 from __future__ import annotations
 
+import csv
+from typing import TYPE_CHECKING
+
 from openf1_client.endpoints.base import BaseEndpoint
 from openf1_client.models import Weather
 from openf1_client.utils import FilterValue
@@ -37,52 +40,61 @@ class WeatherEndpoint(BaseEndpoint[Weather]):
     _endpoint = "weather"
     _model_class = Weather
 
-    def list(
-        self,
-        session_key: int | str | None = None,
-        meeting_key: int | str | None = None,
-        date: FilterValue | None = None,
-        air_temperature: FilterValue | None = None,
-        track_temperature: FilterValue | None = None,
-        humidity: FilterValue | None = None,
-        pressure: FilterValue | None = None,
-        wind_speed: FilterValue | None = None,
-        wind_direction: FilterValue | None = None,
-        rainfall: bool | int | None = None,
-        **extra_filters: FilterValue | None,
-    ) -> list[Weather]:
-        """
-        Fetch weather data.
-
-        Args:
-            session_key: Filter by session (use "latest" for current session).
-            meeting_key: Filter by meeting (use "latest" for current meeting).
-            date: Filter by timestamp (supports comparison operators).
-            air_temperature: Filter by air temp in °C (supports comparisons).
-            track_temperature: Filter by track temp in °C (supports comparisons).
-            humidity: Filter by humidity % (supports comparison operators).
-            pressure: Filter by pressure in mbar (supports comparisons).
-            wind_speed: Filter by wind speed in m/s (supports comparisons).
-            wind_direction: Filter by wind direction in degrees.
-            rainfall: Filter by rainfall status (True/False).
-            **extra_filters: Additional filter parameters.
-
-        Returns:
-            List of Weather instances.
-        """
-        return super().list(
-            session_key=session_key,
-            meeting_key=meeting_key,
-            date=date,
-            air_temperature=air_temperature,
-            track_temperature=track_temperature,
-            humidity=humidity,
-            pressure=pressure,
-            wind_speed=wind_speed,
-            wind_direction=wind_direction,
-            rainfall=rainfall,
-            **extra_filters,
-        )
+    # Minute-tick readings add up to hundreds of rows per session and
+    # the schema is stable, so list() skips per-row validation (see
+    # BaseEndpoint._trust_server).
+    _trust_server = True
+
+    _FILTERS = (
+        "session_key",
+        "meeting_key",
+        "date",
+        "air_temperature",
+        "track_temperature",
+        "humidity",
+        "pressure",
+        "wind_speed",
+        "wind_direction",
+        "rainfall",
+    )
+
+    if TYPE_CHECKING:
+        # Typed stub only: at runtime list() resolves to BaseEndpoint.list,
+        # avoiding a pass-through frame and kwargs copy per call.
+        def list(
+            self,
+            session_key: int | str | None = None,
+            meeting_key: int | str | None = None,
+            date: FilterValue | None = None,
+            air_temperature: FilterValue | None = None,
+            track_temperature: FilterValue | None = None,
+            humidity: FilterValue | None = None,
+            pressure: FilterValue | None = None,
+            wind_speed: FilterValue | None = None,
+            wind_direction: FilterValue | None = None,
+            rainfall: bool | int | None = None,
+            **extra_filters: FilterValue | None,
+        ) -> list[Weather]:
+            """
+            Fetch weather data.
+
+            Args:
+                session_key: Filter by session (use "latest" for current session).
+                meeting_key: Filter by meeting (use "latest" for current meeting).
+                date: Filter by timestamp (supports comparison operators).
+                air_temperature: Filter by air temp in °C (supports comparisons).
+                track_temperature: Filter by track temp in °C (supports comparisons).
+                humidity: Filter by humidity % (supports comparison operators).
+                pressure: Filter by pressure in mbar (supports comparisons).
+                wind_speed: Filter by wind speed in m/s (supports comparisons).
+                wind_direction: Filter by wind direction in degrees.
+                rainfall: Filter by rainfall status (True/False).
+                **extra_filters: Additional filter parameters.
+
+            Returns:
+                List of Weather instances.
+            """
+            ...
 
     def get_latest(self, session_key: int | str) -> Weather | None:
         """
@@ -94,11 +106,24 @@ class WeatherEndpoint(BaseEndpoint[Weather]):
         Returns:
             The most recent Weather instance, or None if no data.
         """
-        weather_data = self.list(session_key=session_key)
-        if not weather_data:
+        # Stream the CSV form and keep only the final row (data is
+        # returned in chronological order), so one reading is parsed
+        # and validated instead of every minute-tick in the session.
+        # The OpenF1 API has no order_by/limit to narrow the fetch.
+        lines = self._transport.iter_csv(self._endpoint, {"session_key": session_key})
+        header = next(lines, None)
+        if header is None:
             return None
-        # Data is typically returned in chronological order
-        return weather_data[-1] if weather_data else None
+        last: str | None = None
+        for line in lines:
+            if line:
+                last = line
+        if last is None:
+            return None
+        row = next(csv.DictReader([header, last]))
+        return self._parse_single(
+            {key: (value if value != "" else None) for key, value in row.items()}
+        )
 
     def get_rain_periods(self, session_key: int | str) -> list[Weather]:
         """
@@ -126,14 +151,22 @@ class WeatherEndpoint(BaseEndpoint[Weather]):
             Dictionary with 'hottest' and 'coldest' Weather instances.
         """
         weather_data = self.list(session_key=session_key)
-        if not weather_data:
-            return {"hottest": None, "coldest": None}
-
-        with_track_temp = [w for w in weather_data if w.track_temperature is not None]
-        if not with_track_temp:
-            return {"hottest": None, "coldest": None}
 
-        hottest = max(with_track_temp, key=lambda w: w.track_temperature or 0)
-        coldest = min(with_track_temp, key=lambda w: w.track_temperature or float("inf"))
+        # Single pass tracking both extremes: one attribute load per row
+        # instead of a filter pass plus separate max() and min() scans.
+        hottest: Weather | None = None
+        coldest: Weather | None = None
+        hottest_temp = float("-inf")
+        coldest_temp = float("inf")
+        for reading in weather_data:
+            temp = reading.track_temperature
+            if temp is None:
+                continue
+            if temp > hottest_temp:
+                hottest_temp = temp
+                hottest = reading
+            if temp < coldest_temp:
+                coldest_temp = temp
+                coldest = reading
 
         return {"hottest": hottest, "coldest": coldest}
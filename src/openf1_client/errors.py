@@ -10,6 +10,12 @@ from __future__ import annotations
 from typing import Any
 
 
+# Longest response-body excerpt included in an API error's string form.
+# Bodies can be multi-KB payloads; formatting happens lazily in __str__
+# and is bounded so logging an exception never serializes the lot.
+_BODY_STR_LIMIT = 512
+
+
 class OpenF1Error(Exception):
     """
     Base exception for all OpenF1 client errors.
@@ -111,7 +117,10 @@ class OpenF1APIError(OpenF1Error):
         if self.request_url:
             parts.append(f"URL: {self.request_url}")
         if self.response_body:
-            parts.append(f"Response: {self.response_body}")
+            body = str(self.response_body)
+            if len(body) > _BODY_STR_LIMIT:
+                body = f"{body[:_BODY_STR_LIMIT]}... (truncated)"
+            parts.append(f"Response: {body}")
         return " | ".join(parts)
 
 
@@ -305,6 +314,41 @@ class OpenF1ValidationError(OpenF1Error):
         return " | ".join(parts)
 
 
+# Default messages and exception dispatch for raise_for_status, built
+# once at import so the error path does a dict lookup instead of
+# reallocating the table and walking an if/elif ladder per response.
+_STATUS_MESSAGES: dict[int, str] = {
+    400: "Bad request",
+    401: "Authentication required",
+    403: "Access forbidden",
+    404: "Resource not found",
+    405: "Method not allowed",
+    408: "Request timeout",
+    422: "Validation error",
+    429: "Rate limit exceeded",
+    500: "Internal server error",
+    502: "Bad gateway",
+    503: "Service unavailable",
+    504: "Gateway timeout",
+}
+
+# Status -> exception class for every code in the HTTP range, with None
+# marking success (2xx, plus 304 from conditional GETs: not an error,
+# the transport serves its cached payload). One subscript replaces the
+# range-comparison cascade on the per-response path.
+_EXC_BY_STATUS: list[type[OpenF1APIError] | None] = [OpenF1APIError] * 600
+for _code in range(200, 300):
+    _EXC_BY_STATUS[_code] = None
+_EXC_BY_STATUS[304] = None
+_EXC_BY_STATUS[401] = OpenF1AuthError
+_EXC_BY_STATUS[403] = OpenF1AuthError
+_EXC_BY_STATUS[404] = OpenF1NotFoundError
+_EXC_BY_STATUS[429] = OpenF1RateLimitError
+for _code in range(500, 600):
+    _EXC_BY_STATUS[_code] = OpenF1ServerError
+del _code
+
+
 def raise_for_status(
     status_code: int,
     response_body: str | dict[str, Any] | None = None,
@@ -330,36 +374,16 @@ def raise_for_status(
         OpenF1ServerError: For 5xx status codes.
         OpenF1APIError: For other non-2xx status codes.
     """
-    if 200 <= status_code < 300:
+    exc_class = (
+        _EXC_BY_STATUS[status_code] if 0 <= status_code < 600 else OpenF1APIError
+    )
+    if exc_class is None:
         return
 
-    # Construct a default message based on status code
-    status_messages = {
-        400: "Bad request",
-        401: "Authentication required",
-        403: "Access forbidden",
-        404: "Resource not found",
-        405: "Method not allowed",
-        408: "Request timeout",
-        422: "Validation error",
-        429: "Rate limit exceeded",
-        500: "Internal server error",
-        502: "Bad gateway",
-        503: "Service unavailable",
-        504: "Gateway timeout",
-    }
-    message = status_messages.get(status_code, f"HTTP error {status_code}")
-
-    # Map to appropriate exception class
-    if status_code in (401, 403):
-        raise OpenF1AuthError(message, status_code, response_body, request_url)
-    elif status_code == 404:
-        raise OpenF1NotFoundError(message, status_code, response_body, request_url)
-    elif status_code == 429:
+    message = _STATUS_MESSAGES.get(status_code, f"HTTP error {status_code}")
+
+    if exc_class is OpenF1RateLimitError:
         raise OpenF1RateLimitError(
             message, status_code, response_body, request_url, retry_after
         )
-    elif 500 <= status_code < 600:
-        raise OpenF1ServerError(message, status_code, response_body, request_url)
-    else:
-        raise OpenF1APIError(message, status_code, response_body, request_url)
+    raise exc_class(message, status_code, response_body, request_url)
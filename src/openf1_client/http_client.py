@@ -7,14 +7,17 @@ OpenF1 API. It handles retries, error mapping, and response processing.
 
 from __future__ import annotations
 
+import functools
 import logging
+import random
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Literal
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Iterator, Literal
 
 import requests
 from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
 from openf1_client.config import ClientConfig
 from openf1_client.errors import (
@@ -25,9 +28,58 @@ from openf1_client.errors import (
 from openf1_client.utils import build_query_params, sanitize_for_logging
 
 
+if TYPE_CHECKING:
+    from openf1_client.auth import AuthManager
+
+# Optional fast JSON decoder (pip install openf1-client[orjson]); the
+# transport falls back to requests' stdlib-based .json() without it.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
 logger = logging.getLogger("openf1_client")
 
 
+@functools.lru_cache(maxsize=1024)
+def _cached_query_params(
+    items: tuple[tuple[str, Any], ...],
+    format: Literal["json", "csv"] | None,
+) -> dict[str, str]:
+    """
+    Memoized build_query_params for hashable filter shapes.
+
+    High-QPS callers reuse a small repertoire of filters; the
+    stringified param dict is built once per shape. The returned dict
+    is shared between calls — treat it as read-only.
+
+    Args:
+        items: The filter dict's items, sorted for a canonical key.
+        format: The response format parameter.
+
+    Returns:
+        The query parameter dict for those filters.
+    """
+    return build_query_params(dict(items), format=format)
+
+# Maximum number of (endpoint, filters) entries kept in the transport's
+# ETag cache before the least recently used entry is evicted.
+ETAG_CACHE_SIZE = 256
+
+# How long a resolved "latest" session key stays valid before being
+# re-resolved against the API.
+LATEST_SESSION_TTL = 30.0
+
+# Jittered exponential backoff for the retry loop: base * 2**attempt
+# scaled by a random factor in [0.5, 1.5), capped so late attempts
+# don't stall callers. Jitter desynchronizes clients retrying against
+# the same outage, avoiding a thundering herd.
+RETRY_BACKOFF_BASE = 0.25
+RETRY_BACKOFF_CAP = 10.0
+
+
+
 class HTTPClientProtocol(ABC):
     """
     Abstract base class defining the HTTP client interface.
@@ -42,9 +94,11 @@ class HTTPClientProtocol(ABC):
         method: str,
         path: str,
         params: dict[str, Any] | None = None,
-        data: dict[str, Any] | None = None,
+        data: dict[str, Any] | bytes | None = None,
         headers: dict[str, str] | None = None,
         timeout: float | tuple[float, float] | None = None,
+        stream: bool = False,
+        skip_auth: bool = False,
     ) -> requests.Response:
         """
         Make an HTTP request.
@@ -56,6 +110,8 @@ class HTTPClientProtocol(ABC):
             data: Request body data.
             headers: Additional headers.
             timeout: Optional timeout override.
+            stream: Stream the response body instead of loading it eagerly.
+            skip_auth: Do not attach a Bearer token.
 
         Returns:
             The HTTP response.
@@ -110,6 +166,19 @@ class SyncHTTPClient(HTTPClientProtocol):
         self.config = config
         self.session = self._create_session()
         self._base_url = config.base_url.rstrip("/")
+        self._auth_manager: AuthManager | None = None
+        # Authorization header cached per token value, so the per-call
+        # path allocates no dict until the token actually changes.
+        self._auth_token: str | None = None
+        self._auth_header: dict[str, str] | None = None
+        # Per-call constants hoisted off the config (which is treated
+        # as immutable after construction) to keep request() tight.
+        self._default_timeout = config.get_timeout()
+        self._verify = config.verify_ssl
+        # path -> full URL; the client only ever sees the dozen or so
+        # endpoint paths, so joins happen once each. Bounded in case a
+        # caller generates paths dynamically.
+        self._url_cache: dict[str, str] = {}
 
     def _create_session(self) -> requests.Session:
         """
@@ -120,20 +189,23 @@ class SyncHTTPClient(HTTPClientProtocol):
         """
         session = requests.Session()
 
-        # Configure retries
-        retry_strategy = Retry(
-            total=self.config.max_retries,
-            backoff_factor=0.5,
-            status_forcelist=self.config.retry_on_status,
-            allowed_methods=["GET", "POST"],
-            raise_on_status=False,
+        # Retries are handled by the explicit loop in request(), which
+        # adds jitter and logging urllib3's in-adapter Retry lacks.
+        # Pool sized so concurrent fan-outs (list_many, fetch_many)
+        # reuse warm keep-alive TLS connections instead of paying a
+        # handshake each; tunable via config for heavier workloads.
+        adapter = HTTPAdapter(
+            max_retries=0,
+            pool_connections=self.config.pool_maxsize,
+            pool_maxsize=self.config.pool_maxsize,
         )
-
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
-        # Set default headers
+        # Set default headers. Accept-Encoding is left to urllib3,
+        # which advertises br/zstd alongside gzip when the optional
+        # decoders are installed (pip install openf1-client[compression])
+        # — worth ~30% fewer ingress bytes on large telemetry payloads.
         session.headers.update(self.config.get_headers())
 
         return session
@@ -143,44 +215,81 @@ class SyncHTTPClient(HTTPClientProtocol):
         Build a full URL from a path.
 
         Args:
-            path: The URL path.
+            path: The URL path, or an absolute URL (used as-is, e.g.
+                for token requests against a different base).
 
         Returns:
             The full URL.
         """
-        path = path.lstrip("/")
-        return f"{self._base_url}/{path}"
+        url = self._url_cache.get(path)
+        if url is None:
+            if path.startswith(("http://", "https://")):
+                url = path
+            else:
+                url = f"{self._base_url}/{path.lstrip('/')}"
+            if len(self._url_cache) < 256:
+                self._url_cache[path] = url
+        return url
+
+    def bind_auth(self, auth_manager: AuthManager) -> None:
+        """
+        Bind an auth manager so requests pick up tokens at send time.
+
+        With a bound manager the client injects the current token into
+        every request, so the transport never needs to be rebuilt when
+        tokens are obtained or refreshed.
+
+        Args:
+            auth_manager: The auth manager to read tokens from.
+        """
+        self._auth_manager = auth_manager
 
-    def _get_auth_header(self) -> dict[str, str]:
+    def _get_auth_header(self) -> dict[str, str] | None:
         """
         Get the authorization header if a token is available.
 
+        The header dict is built once per token value and reused across
+        requests; treat it as read-only.
+
         Returns:
-            A dictionary containing the Authorization header, or empty dict.
+            A dictionary containing the Authorization header, or None.
         """
-        if self.config.access_token:
-            return {"Authorization": f"Bearer {self.config.access_token}"}
-        return {}
+        token: str | None = None
+        if self._auth_manager is not None:
+            token = self._auth_manager.get_token()
+        if not token:
+            token = self.config.access_token
+        if not token:
+            return None
+        if token != self._auth_token:
+            self._auth_token = token
+            self._auth_header = {"Authorization": f"Bearer {token}"}
+        return self._auth_header
 
     def request(
         self,
         method: str,
         path: str,
         params: dict[str, Any] | None = None,
-        data: dict[str, Any] | None = None,
+        data: dict[str, Any] | bytes | None = None,
         headers: dict[str, str] | None = None,
         timeout: float | tuple[float, float] | None = None,
+        stream: bool = False,
+        skip_auth: bool = False,
     ) -> requests.Response:
         """
         Make an HTTP request to the API.
 
         Args:
             method: HTTP method (GET, POST, etc.).
-            path: URL path relative to base URL.
+            path: URL path relative to base URL, or an absolute URL.
             params: Query parameters.
             data: Request body data (for POST).
             headers: Additional headers.
             timeout: Optional timeout override.
+            stream: Stream the response body instead of loading it eagerly.
+            skip_auth: Do not attach a Bearer token (token requests
+                must not carry one).
 
         Returns:
             The HTTP response.
@@ -191,79 +300,146 @@ class SyncHTTPClient(HTTPClientProtocol):
             OpenF1APIError: If the API returns an error response.
         """
         url = self._build_url(path)
-        request_timeout = timeout or self.config.get_timeout()
-
-        # Merge headers
-        request_headers = self._get_auth_header()
-        if headers:
-            request_headers.update(headers)
-
-        # Log the request (without sensitive data)
-        logger.debug(
-            "HTTP %s %s params=%s",
-            method,
-            url,
-            sanitize_for_logging(params),
-        )
-
-        try:
-            start_time = time.monotonic()
-            response = self.session.request(
-                method=method,
-                url=url,
-                params=params,
-                data=data,
-                headers=request_headers,
-                timeout=request_timeout,
-                verify=self.config.verify_ssl,
-            )
-            elapsed = time.monotonic() - start_time
-
-            # Log the response
+        request_timeout = timeout if timeout is not None else self._default_timeout
+
+        # Merge headers only when both sides exist; the common call
+        # passes headers=None and reuses the cached auth dict (or None,
+        # which requests treats as no extra headers).
+        auth_header = None if skip_auth else self._get_auth_header()
+        if headers and auth_header:
+            request_headers: dict[str, str] | None = {**auth_header, **headers}
+        else:
+            request_headers = headers or auth_header
+
+        # Resolved once per call: when the logger sits above DEBUG (the
+        # production default), the request path skips param
+        # sanitization and the monotonic timing reads entirely.
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            # Log the request (without sensitive data)
             logger.debug(
-                "HTTP %s %s -> %d (%.2fs)",
+                "HTTP %s %s params=%s",
                 method,
                 url,
-                response.status_code,
-                elapsed,
+                sanitize_for_logging(params),
             )
 
-            # Check for errors and raise appropriate exceptions
+        attempts = self.config.max_retries + 1
+        for attempt in range(attempts):
+            try:
+                if debug:
+                    start_time = time.monotonic()
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    data=data,
+                    headers=request_headers,
+                    timeout=request_timeout,
+                    verify=self._verify,
+                    stream=stream,
+                )
+                if debug:
+                    # Log the response
+                    logger.debug(
+                        "HTTP %s %s -> %d (%.2fs)",
+                        method,
+                        url,
+                        response.status_code,
+                        time.monotonic() - start_time,
+                    )
+
+            except requests.exceptions.Timeout as e:
+                logger.error("Request timeout: %s", url)
+                raise OpenF1TimeoutError(
+                    message=f"Request to {url} timed out",
+                    timeout=request_timeout
+                    if isinstance(request_timeout, float)
+                    else request_timeout[1],
+                    original_error=e,
+                ) from e
+
+            except requests.exceptions.ConnectionError as e:
+                if attempt + 1 < attempts:
+                    delay = self._backoff_delay(attempt)
+                    logger.warning(
+                        "Connection error on %s, retrying in %.2fs "
+                        "(attempt %d/%d): %s",
+                        url,
+                        delay,
+                        attempt + 1,
+                        attempts - 1,
+                        e,
+                    )
+                    time.sleep(delay)
+                    continue
+                logger.error("Connection error: %s - %s", url, e)
+                raise OpenF1TransportError(
+                    message=f"Failed to connect to {url}",
+                    original_error=e,
+                ) from e
+
+            except requests.exceptions.RequestException as e:
+                logger.error("Request error: %s - %s", url, e)
+                raise OpenF1TransportError(
+                    message=f"Request to {url} failed",
+                    original_error=e,
+                ) from e
+
+            status_code = response.status_code
             retry_after = response.headers.get("Retry-After")
             retry_after_int = int(retry_after) if retry_after else None
 
+            if status_code in self.config.retry_on_status and attempt + 1 < attempts:
+                # Honor the server's Retry-After when present, clamped
+                # to the backoff cap so a pathological header can't
+                # stall the caller; else back off with jitter.
+                delay = (
+                    min(RETRY_BACKOFF_CAP, float(retry_after_int))
+                    if retry_after_int is not None
+                    else self._backoff_delay(attempt)
+                )
+                logger.warning(
+                    "HTTP %d on %s, retrying in %.2fs (attempt %d/%d)",
+                    status_code,
+                    url,
+                    delay,
+                    attempt + 1,
+                    attempts - 1,
+                )
+                time.sleep(delay)
+                continue
+
+            # Check for errors and raise appropriate exceptions. The body
+            # is only parsed on error statuses, so successful streamed
+            # responses are not drained here.
             raise_for_status(
-                status_code=response.status_code,
-                response_body=self._parse_response_body(response),
+                status_code=status_code,
+                response_body=self._parse_response_body(response)
+                if status_code >= 400
+                else None,
                 request_url=url,
                 retry_after=retry_after_int,
             )
 
             return response
 
-        except requests.exceptions.Timeout as e:
-            logger.error("Request timeout: %s", url)
-            raise OpenF1TimeoutError(
-                message=f"Request to {url} timed out",
-                timeout=request_timeout
-                if isinstance(request_timeout, float)
-                else request_timeout[1],
-                original_error=e,
-            ) from e
-
-        except requests.exceptions.ConnectionError as e:
-            logger.error("Connection error: %s - %s", url, e)
-            raise OpenF1TransportError(
-                message=f"Failed to connect to {url}",
-                original_error=e,
-            ) from e
-
-        except requests.exceptions.RequestException as e:
-            logger.error("Request error: %s - %s", url, e)
-            raise OpenF1TransportError(
-                message=f"Request to {url} failed",
-                original_error=e,
-            ) from e
+        # Unreachable: the final attempt above either returns or raises.
+        raise OpenF1TransportError(message=f"Request to {url} failed")
+
+    @staticmethod
+    def _backoff_delay(attempt: int) -> float:
+        """
+        Compute a jittered exponential backoff delay.
+
+        Args:
+            attempt: Zero-based index of the attempt that just failed.
+
+        Returns:
+            Seconds to sleep before the next attempt.
+        """
+        base = min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * (2**attempt))
+        return base * random.uniform(0.5, 1.5)
 
     def _parse_response_body(self, response: requests.Response) -> str | dict[str, Any]:
         """
@@ -276,6 +452,8 @@ class SyncHTTPClient(HTTPClientProtocol):
             The parsed response body (JSON dict or raw text).
         """
         try:
+            if _orjson is not None:
+                return _orjson.loads(response.content)
             return response.json()
         except ValueError:
             return response.text
@@ -349,6 +527,53 @@ class OpenF1Transport:
         """
         self._http = http_client
         self._config = config
+        # Conditional-GET cache: (endpoint, params) -> (etag,
+        # last_modified, parsed result). Repeat calls send If-None-Match
+        # / If-Modified-Since and serve the stored payload on 304,
+        # skipping decompression, JSON parsing, and model validation.
+        self._etag_cache: OrderedDict[
+            tuple[str, tuple[tuple[str, str], ...]],
+            tuple[str | None, str | None, Any],
+        ] = OrderedDict()
+        # Cached resolution of the "latest" session alias, so scripts
+        # touching several endpoints only pay the lookup once per TTL.
+        self._latest_session_key: int | None = None
+        self._latest_session_deadline = 0.0
+
+    def resolve_latest_session(self) -> int | None:
+        """
+        Resolve the "latest" session alias to its numeric key.
+
+        The resolution is cached for LATEST_SESSION_TTL seconds; within
+        that window every endpoint shares one answer, so requests carry
+        a concrete key that local and HTTP caches can match on.
+
+        Returns:
+            The current session's numeric key, or None if the API
+            returned no session.
+        """
+        now = time.monotonic()
+        if self._latest_session_key is not None and now < self._latest_session_deadline:
+            return self._latest_session_key
+        data = self.fetch_json("sessions", {"session_key": "latest"})
+        if not data:
+            return None
+        key = data[0].get("session_key")
+        if key is not None:
+            self._latest_session_key = key
+            self._latest_session_deadline = now + LATEST_SESSION_TTL
+        return key
+
+    def invalidate_latest_session(self) -> None:
+        """
+        Drop the cached "latest" resolution.
+
+        Called when a query against the resolved key 404s (session
+        rollover inside the TTL window), so the next aliased call
+        re-resolves instead of reusing the stale key until expiry.
+        """
+        self._latest_session_key = None
+        self._latest_session_deadline = 0.0
 
     def fetch(
         self,
@@ -369,13 +594,61 @@ class OpenF1Transport:
             For CSV format: The raw CSV string.
         """
         effective_format = format or self._config.default_format
-        params = build_query_params(filters or {}, format=effective_format)
-
-        response = self._http.get(endpoint, params=params)
+        # Operator filters carry dict values, which are unhashable;
+        # those fall back to a direct build.
+        try:
+            params = _cached_query_params(
+                tuple(sorted((filters or {}).items())), effective_format
+            )
+        except TypeError:
+            params = build_query_params(filters or {}, format=effective_format)
+
+        cache_key = (endpoint, tuple(sorted(params.items())))
+        cached = self._etag_cache.get(cache_key)
+
+        headers: dict[str, str] | None = None
+        if cached is not None:
+            headers = {}
+            if cached[0]:
+                headers["If-None-Match"] = cached[0]
+            if cached[1]:
+                headers["If-Modified-Since"] = cached[1]
+        response = self._http.get(endpoint, params=params, headers=headers)
+
+        if response.status_code == 304:
+            if cached is not None:
+                self._etag_cache.move_to_end(cache_key)
+                return cached[2]
+            # 304 with nothing cached (e.g. a proxy replaying a stale
+            # validator): the body is empty, so falling through would
+            # surface a raw JSON decode error. Retry once without
+            # validators to force a full response; a second 304 on an
+            # unconditional request is a protocol violation.
+            response = self._http.get(endpoint, params=params)
+            if response.status_code == 304:
+                raise OpenF1TransportError(
+                    message=(
+                        f"Server returned 304 Not Modified for {endpoint} "
+                        "on an unconditional request"
+                    )
+                )
 
         if effective_format == "csv":
-            return response.text
-        return response.json()
+            result: list[dict[str, Any]] | str = response.text
+        elif _orjson is not None:
+            result = _orjson.loads(response.content)
+        else:
+            result = response.json()
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._etag_cache[cache_key] = (etag, last_modified, result)
+            self._etag_cache.move_to_end(cache_key)
+            if len(self._etag_cache) > ETAG_CACHE_SIZE:
+                self._etag_cache.popitem(last=False)
+
+        return result
 
     def fetch_json(
         self,
@@ -397,6 +670,41 @@ class OpenF1Transport:
             return []
         return result
 
+    def fetch_many(
+        self,
+        queries: list[tuple[str, dict[str, Any] | None]],
+        max_workers: int = 8,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Fetch several endpoint queries concurrently.
+
+        Overlaps the round-trips on a thread pool over the shared
+        connection pool, so pulling laps, car data and intervals for a
+        session costs roughly one RTT instead of their sum. Each query
+        still goes through fetch_json, so conditional-GET caching
+        applies per query.
+
+        Args:
+            queries: (endpoint, filters) pairs, one per request.
+            max_workers: Upper bound on concurrent requests.
+
+        Returns:
+            One decoded JSON list per query, in input order.
+
+        Raises:
+            OpenF1APIError: If any query returns an error.
+        """
+        if not queries:
+            return []
+        if len(queries) == 1:
+            endpoint, filters = queries[0]
+            return [self.fetch_json(endpoint, filters)]
+        workers = min(max_workers, len(queries))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(lambda query: self.fetch_json(*query), queries)
+            )
+
     def fetch_csv(
         self,
         endpoint: str,
@@ -417,6 +725,31 @@ class OpenF1Transport:
             return ""
         return result
 
+    def iter_csv(
+        self,
+        endpoint: str,
+        filters: dict[str, Any] | None = None,
+    ) -> Iterator[str]:
+        """
+        Stream CSV data from an API endpoint line by line.
+
+        Streams the HTTP response instead of materializing the whole CSV
+        body as one string, so peak memory stays at roughly one row.
+
+        Args:
+            endpoint: The endpoint path.
+            filters: Filter parameters to apply.
+
+        Yields:
+            Decoded CSV lines, starting with the header line.
+        """
+        params = build_query_params(filters or {}, format="csv")
+        response = self._http.get(endpoint, params=params, stream=True)
+        try:
+            yield from response.iter_lines(decode_unicode=True)
+        finally:
+            response.close()
+
     def post_form(
         self,
         url: str,
@@ -434,23 +767,51 @@ class OpenF1Transport:
         Returns:
             The JSON response.
         """
-        # For token requests, we need to post to an absolute URL
-        response = self._http.session.post(
+        # Token requests post to an absolute URL and must not carry a
+        # Bearer header; routing through request() reuses the session,
+        # retry loop, and error mapping.
+        response = self._http.request(
+            "POST",
             url,
             data=data,
             headers={"Content-Type": "application/x-www-form-urlencoded"},
-            timeout=self._config.get_timeout(),
-            verify=self._config.verify_ssl,
+            skip_auth=True,
         )
+        return response.json()
 
-        raise_for_status(
-            status_code=response.status_code,
-            response_body=response.text,
-            request_url=url,
-        )
+    def post_form_bytes(
+        self,
+        url: str,
+        body: bytes,
+    ) -> dict[str, Any]:
+        """
+        Make a POST request with a pre-encoded form body.
+
+        Variant of post_form for callers that encode their form data once
+        and reuse it (e.g. OAuth2 refreshes), skipping the per-request
+        urlencode.
+
+        Args:
+            url: The full URL to post to.
+            body: The urlencoded form body as bytes.
 
+        Returns:
+            The JSON response.
+        """
+        response = self._http.request(
+            "POST",
+            url,
+            data=body,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            skip_auth=True,
+        )
         return response.json()
 
+    def clear_cache(self) -> None:
+        """Clear the ETag response cache and the "latest" resolution."""
+        self._etag_cache.clear()
+        self.invalidate_latest_session()
+
     def close(self) -> None:
         """Close the transport and release resources."""
         self._http.close()
@@ -0,0 +1,113 @@
+"""Tests for the endpoint response cache."""
+
+import pytest
+import responses
+
+from openf1_client import OpenF1Client
+from openf1_client.config import DEFAULT_BASE_URL
+
+LAPS_PAYLOAD = [
+    {
+        "session_key": 9161,
+        "driver_number": 63,
+        "lap_number": 1,
+        "lap_duration": 95.123,
+    },
+]
+
+
+class TestResponseCache:
+    """Tests for the per-endpoint parsed-response cache."""
+
+    @responses.activate
+    def test_repeated_list_hits_cache(self) -> None:
+        """Test that an identical list() call is served from cache."""
+        responses.add(
+            responses.GET,
+            f"{DEFAULT_BASE_URL}/laps",
+            json=LAPS_PAYLOAD,
+            status=200,
+        )
+
+        with OpenF1Client() as client:
+            first = client.laps.list(session_key=9161, driver_number=63)
+            second = client.laps.list(session_key=9161, driver_number=63)
+
+        assert len(responses.calls) == 1
+        assert len(first) == 1
+        assert second == first
+
+    @responses.activate
+    def test_different_filters_miss_cache(self) -> None:
+        """Test that a different filter set triggers a new request."""
+        responses.add(
+            responses.GET,
+            f"{DEFAULT_BASE_URL}/laps",
+            json=LAPS_PAYLOAD,
+            status=200,
+        )
+
+        with OpenF1Client() as client:
+            client.laps.list(session_key=9161, driver_number=63)
+            client.laps.list(session_key=9161, driver_number=44)
+
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_expired_entry_refetches(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that an entry past its TTL is fetched again."""
+        # A negative TTL stamps every entry with a deadline already in
+        # the past, so the freshness check always sees it as expired.
+        monkeypatch.setattr(
+            "openf1_client.endpoints.base._RESPONSE_CACHE_TTL", -1.0
+        )
+        responses.add(
+            responses.GET,
+            f"{DEFAULT_BASE_URL}/laps",
+            json=LAPS_PAYLOAD,
+            status=200,
+        )
+
+        with OpenF1Client() as client:
+            client.laps.list(session_key=9161, driver_number=63)
+            client.laps.list(session_key=9161, driver_number=63)
+
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_latest_alias_bypasses_cache(self) -> None:
+        """Test that session_key="latest" is never answered from cache.
+
+        The sessions endpoint forwards the alias to the API verbatim,
+        and its answer shifts as new sessions start, so each call must
+        go to the network.
+        """
+        responses.add(
+            responses.GET,
+            f"{DEFAULT_BASE_URL}/sessions",
+            json=[{"session_key": 9161, "session_name": "Race"}],
+            status=200,
+        )
+
+        with OpenF1Client() as client:
+            client.sessions.list(session_key="latest")
+            client.sessions.list(session_key="latest")
+
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_clear_cache_forces_refetch(self) -> None:
+        """Test that clearing the client cache drops cached responses."""
+        responses.add(
+            responses.GET,
+            f"{DEFAULT_BASE_URL}/laps",
+            json=LAPS_PAYLOAD,
+            status=200,
+        )
+
+        with OpenF1Client() as client:
+            client.laps.list(session_key=9161, driver_number=63)
+            client.laps.clear_memo_cache()
+            client.laps.list(session_key=9161, driver_number=63)
+
+        assert len(responses.calls) == 2
@@ -119,6 +119,14 @@ class TestRaiseForStatus:
         for code in [200, 201, 204]:
             raise_for_status(code)  # Should not raise
 
+    def test_304_no_raise(self) -> None:
+        """Test that 304 Not Modified doesn't raise.
+
+        304 is a successful conditional-GET outcome; the transport
+        serves its cached payload for it.
+        """
+        raise_for_status(304)  # Should not raise
+
     def test_401_raises_auth_error(self) -> None:
         """Test that 401 raises OpenF1AuthError."""
         with pytest.raises(OpenF1AuthError) as exc: